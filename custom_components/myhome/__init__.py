@@ -1,15 +1,23 @@
 """ MyHOME integration enhanced with OpenHAB-style patterns. """
 
-import aiofiles
-import yaml
+import copy
+import hashlib
+import os
+import sys
+from functools import partial
+from pathlib import Path
+
+import orjson
+import voluptuous as vol
 
 from OWNd.message import OWNCommand, OWNGatewayCommand
 
 from homeassistant.config_entries import SOURCE_REAUTH, ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr, entity_registry as er, config_validation as cv
 from homeassistant.const import CONF_MAC
+from homeassistant.loader import async_get_integration
 
 from .const import (
     ATTR_GATEWAY,
@@ -21,25 +29,34 @@ from .const import (
     CONF_WORKER_COUNT,
     CONF_FILE_PATH,
     CONF_GENERATE_EVENTS,
+    DEFAULT_WORKER_COUNT,
     DOMAIN,
     LOGGER,
     ALL_DEVICE_SUPPORTED_TYPES,
     DEVICE_TYPE_TO_PLATFORM,
 )
+from . import validate
 from .validate import config_schema, format_mac
 from .gateway import MyHOMEGatewayHandler
-from .device_factory import MyHOMEDeviceFactory
-from .config_flow_discovery import async_setup_discovery
+from .config_flow_discovery import async_setup_discovery, async_unload_discovery
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 PLATFORMS = ["light", "switch", "cover", "climate", "binary_sensor", "sensor"]
 
+# Validated configuration per file path, along with the (mtime, size) it was read at
+_CONFIG_CACHE: dict[str, tuple[int, int, dict]] = {}
+
 
 async def async_setup(hass, config):
     """Set up the MyHOME component."""
     hass.data[DOMAIN] = {}
 
     if DOMAIN not in config:
+        # Services are not tied to a config entry, register them once for all gateways
+        hass.services.async_register(DOMAIN, "sync_time", partial(handle_sync_time, hass))
+        hass.services.async_register(DOMAIN, "send_message", partial(handle_send_message, hass))
+        hass.services.async_register(DOMAIN, "start_discovery", partial(handle_start_discovery, hass))
+        hass.services.async_register(DOMAIN, "stop_discovery", partial(handle_stop_discovery, hass))
         return True
 
     LOGGER.error("configuration.yaml not supported for this component!")
@@ -47,9 +64,206 @@ async def async_setup(hass, config):
     return False
 
 
+async def _load_validated_config(hass: HomeAssistant, path: str) -> dict:
+    """Load and validate the configuration file, reusing the last result while the file is unchanged."""
+    # Only needed once a gateway is actually set up
+    import aiofiles
+    import yaml
+
+    stat = await hass.async_add_executor_job(os.stat, path)
+    if stat.st_size == 0:
+        LOGGER.info(f"Configuration file '{path}' is empty, using empty configuration")
+        return {}
+
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return copy.deepcopy(cached[2])
+
+    # A JSON dump of the validated configuration is kept in .storage and preferred
+    # over the YAML file as long as the file is the one it was read from, like the
+    # in-memory cache it is keyed by the (mtime, size) taken before the read. The
+    # dump is also stamped with the integration version and the schema module, an
+    # upgrade may change the schema or its defaults and the YAML must then be
+    # validated again.
+    integration = await async_get_integration(hass, DOMAIN)
+    schema_stat = await hass.async_add_executor_job(os.stat, validate.__file__)
+    cache_version = f"{integration.version}:{schema_stat.st_mtime_ns}"
+    path_hash = hashlib.sha1(path.encode(), usedforsecurity=False).hexdigest()[:12]
+    cache_path = hass.config.path(".storage", f"{DOMAIN}.config_cache.{path_hash}.json")
+    validated_config = None
+    try:
+        cache = orjson.loads(
+            await hass.async_add_executor_job(Path(cache_path).read_bytes)
+        )
+        if (
+            isinstance(cache, dict)
+            and cache.get("version") == cache_version
+            and cache.get("mtime_ns") == stat.st_mtime_ns
+            and cache.get("size") == stat.st_size
+            and isinstance(cache.get("config"), dict)
+        ):
+            validated_config = cache["config"]
+    except FileNotFoundError:
+        pass
+    except (OSError, orjson.JSONDecodeError) as e:
+        LOGGER.debug(f"Ignoring configuration cache '{cache_path}': {e}")
+
+    if validated_config is None:
+        # libyaml decodes the raw bytes itself, read them in a single executor job
+        yaml_content = await hass.async_add_executor_job(Path(path).read_bytes)
+        # Prefer the libyaml C loader, falling back to the pure-Python one
+        parsed_yaml = yaml.load(yaml_content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+        # Handle empty or invalid YAML content
+        if parsed_yaml is None or not isinstance(parsed_yaml, dict):
+            LOGGER.info(f"Configuration file '{path}' is empty or invalid, using empty configuration")
+            validated_config = {}
+        else:
+            # Filter out 'service' key if present (not part of device config)
+            if parsed_yaml.pop('service', None) is not None:
+                LOGGER.info("Filtering out 'service' key from configuration - not supported in device config")
+            validated_config = config_schema(parsed_yaml)
+
+        try:
+            async with aiofiles.open(cache_path, mode="wb") as cache_file:
+                await cache_file.write(
+                    orjson.dumps({
+                        "version": cache_version,
+                        "mtime_ns": stat.st_mtime_ns,
+                        "size": stat.st_size,
+                        "config": validated_config,
+                    })
+                )
+        except (OSError, orjson.JSONEncodeError) as e:
+            LOGGER.debug(f"Could not write configuration cache '{cache_path}': {e}")
+
+    # The caller stores the result in hass.data and mutates it, keep a private copy
+    _CONFIG_CACHE[path] = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(validated_config))
+    return validated_config
+
+
+def _default_gateway(hass: HomeAssistant):
+    """Return the first configured gateway, skipping the shared discovery flow."""
+    return next((key for key in hass.data[DOMAIN] if key != "discovery"), None)
+
+
+async def handle_sync_time(hass: HomeAssistant, call: ServiceCall):
+    gateway = call.data.get(ATTR_GATEWAY, None)
+    if gateway is None:
+        gateway = _default_gateway(hass)
+    else:
+        mac = format_mac(gateway)
+        if mac is None:
+            LOGGER.error(
+                "Invalid gateway mac `%s`, could not send time synchronisation message.",
+                gateway,
+            )
+            return False
+        else:
+            gateway = mac
+    timezone = hass.config.time_zone
+    if gateway in hass.data[DOMAIN]:
+        await hass.data[DOMAIN][gateway][CONF_ENTITY].send(
+            OWNGatewayCommand.set_datetime_to_now(timezone)
+        )
+    else:
+        LOGGER.error(
+            "Gateway `%s` not found, could not send time synchronisation message.",
+            gateway,
+        )
+        return False
+
+
+async def handle_send_message(hass: HomeAssistant, call: ServiceCall):
+    gateway = call.data.get(ATTR_GATEWAY, None)
+    message = call.data.get(ATTR_MESSAGE, None)
+    if gateway is None:
+        gateway = _default_gateway(hass)
+    else:
+        mac = format_mac(gateway)
+        if mac is None:
+            LOGGER.error(
+                "Invalid gateway mac `%s`, could not send message `%s`.",
+                gateway,
+                message,
+            )
+            return False
+        else:
+            gateway = mac
+    LOGGER.debug("Handling message `%s` to be sent to `%s`", message, gateway)
+    if gateway in hass.data[DOMAIN]:
+        if message is not None:
+            own_message = OWNCommand.parse(message)
+            if own_message is not None:
+                if own_message.is_valid:
+                    LOGGER.debug(
+                        "%s Sending valid OpenWebNet Message: `%s`",
+                        hass.data[DOMAIN][gateway][CONF_ENTITY].log_id,
+                        own_message,
+                    )
+                    await hass.data[DOMAIN][gateway][CONF_ENTITY].send(own_message)
+            else:
+                LOGGER.error(
+                    "Could not parse message `%s`, not sending it.", message
+                )
+                return False
+    else:
+        LOGGER.error(
+            "Gateway `%s` not found, could not send message `%s`.", gateway, message
+        )
+        return False
+
+
+async def handle_start_discovery(hass: HomeAssistant, call: ServiceCall):
+    gateway = call.data.get(ATTR_GATEWAY, None)
+    if gateway is None:
+        gateway = _default_gateway(hass)
+    else:
+        mac = format_mac(gateway)
+        if mac is None:
+            LOGGER.error("Invalid gateway mac `%s`, could not start discovery.", gateway)
+            return False
+        else:
+            gateway = mac
+    
+    # Scripts may pass the flag as a string such as "false"
+    try:
+        rediscover = cv.boolean(call.data.get("rediscover", False))
+    except vol.Invalid:
+        LOGGER.error("Invalid rediscover value `%s`, could not start discovery.", call.data["rediscover"])
+        return False
+    
+    if gateway in hass.data[DOMAIN]:
+        await hass.data[DOMAIN][gateway][CONF_ENTITY].start_device_discovery(rediscover)
+        LOGGER.info("Started device discovery on gateway %s", gateway)
+    else:
+        LOGGER.error("Gateway `%s` not found, could not start discovery.", gateway)
+        return False
+
+
+async def handle_stop_discovery(hass: HomeAssistant, call: ServiceCall):
+    gateway = call.data.get(ATTR_GATEWAY, None)
+    if gateway is None:
+        gateway = _default_gateway(hass)
+    else:
+        mac = format_mac(gateway)
+        if mac is None:
+            LOGGER.error("Invalid gateway mac `%s`, could not stop discovery.", gateway)
+            return False
+        else:
+            gateway = mac
+    
+    if gateway in hass.data[DOMAIN]:
+        await hass.data[DOMAIN][gateway][CONF_ENTITY].stop_device_discovery()
+        LOGGER.info("Stopped device discovery on gateway %s", gateway)
+    else:
+        LOGGER.error("Gateway `%s` not found, could not stop discovery.", gateway)
+        return False
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
-    if entry.data[CONF_MAC] not in hass.data[DOMAIN]:
-        hass.data[DOMAIN][entry.data[CONF_MAC]] = {}
+    mac = entry.data[CONF_MAC]
+    if mac not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][mac] = {}
 
     _config_file_path = (
         str(entry.options[CONF_FILE_PATH])
@@ -63,21 +277,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     )
 
     try:
-        async with aiofiles.open(_config_file_path, mode="r") as yaml_file:
-            yaml_content = await yaml_file.read()
-            parsed_yaml = yaml.safe_load(yaml_content)
-            # Handle empty or invalid YAML content
-            if parsed_yaml is None or not isinstance(parsed_yaml, dict):
-                LOGGER.info(f"Configuration file '{_config_file_path}' is empty or invalid, using empty configuration")
-                _validated_config = {}
-            else:
-                # Filter out 'service' key if present (not part of device config)
-                if 'service' in parsed_yaml:
-                    LOGGER.info("Filtering out 'service' key from configuration - not supported in device config")
-                    parsed_yaml = {k: v for k, v in parsed_yaml.items() if k != 'service'}
-                _validated_config = config_schema(parsed_yaml)
+        _validated_config = await _load_validated_config(hass, _config_file_path)
     except FileNotFoundError:
         LOGGER.info(f"Configuration file '{_config_file_path}' not found, creating empty configuration file")
+        import aiofiles
+
         try:
             # Create an empty YAML configuration file
             async with aiofiles.open(_config_file_path, mode="w") as yaml_file:
@@ -92,15 +296,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     gateway_config = None
     if "gateway" in _validated_config:
         gateway_config = _validated_config["gateway"]
-    elif entry.data[CONF_MAC] in _validated_config:
-        gateway_config = _validated_config[entry.data[CONF_MAC]]
+    elif mac in _validated_config:
+        gateway_config = _validated_config[mac]
     
     if gateway_config:
-        hass.data[DOMAIN][entry.data[CONF_MAC]] = gateway_config
+        gw_data = gateway_config
     else:
         # Initialize empty configuration for this gateway - will be populated via config flow
-        LOGGER.info(f"Gateway {entry.data[CONF_MAC]} not found in configuration file, initializing with empty configuration")
-        hass.data[DOMAIN][entry.data[CONF_MAC]] = {CONF_PLATFORMS: {}}
+        LOGGER.info(f"Gateway {mac} not found in configuration file, initializing with empty configuration")
+        gw_data = {CONF_PLATFORMS: {}}
+    hass.data[DOMAIN][mac] = gw_data
 
     # Migrating the config entry's unique_id if it was not formated to the recommended hass standard
     if entry.unique_id != dr.format_mac(entry.unique_id):
@@ -109,19 +314,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         )
         LOGGER.warning("Migrating config entry unique_id to %s", entry.unique_id)
 
-    hass.data[DOMAIN][entry.data[CONF_MAC]][CONF_ENTITY] = MyHOMEGatewayHandler(
+    gateway = gw_data[CONF_ENTITY] = MyHOMEGatewayHandler(
         hass=hass, config_entry=entry, generate_events=_generate_events
     )
 
     try:
-        tests_results = await hass.data[DOMAIN][entry.data[CONF_MAC]][
-            CONF_ENTITY
-        ].test()
+        tests_results = await gateway.test()
     except OSError as ose:
-        _gateway_handler = hass.data[DOMAIN][entry.data[CONF_MAC]][CONF_ENTITY]
-        _host = _gateway_handler.gateway.host
+        _host = gateway.gateway.host
         # Clean up the gateway handler before raising the exception
-        del hass.data[DOMAIN][entry.data[CONF_MAC]][CONF_ENTITY]
+        del gw_data[CONF_ENTITY]
         raise ConfigEntryNotReady(
             f"Gateway cannot be reached at {_host}, make sure its address is correct."
         ) from ose
@@ -138,13 +340,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
                     data=entry.data,
                 )
             )
-        del hass.data[DOMAIN][entry.data[CONF_MAC]][CONF_ENTITY]
+        del gw_data[CONF_ENTITY]
         return False
 
     _command_worker_count = (
         int(entry.options[CONF_WORKER_COUNT])
         if CONF_WORKER_COUNT in entry.options
-        else 1
+        else DEFAULT_WORKER_COUNT
     )
 
     entity_registry = er.async_get(hass)
@@ -152,38 +354,34 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     gateway_device_entry = device_registry.async_get_or_create(
         config_entry_id=entry.entry_id,
-        connections={(dr.CONNECTION_NETWORK_MAC, entry.data[CONF_MAC])},
-        identifiers={
-            (DOMAIN, hass.data[DOMAIN][entry.data[CONF_MAC]][CONF_ENTITY].unique_id)
-        },
-        manufacturer=hass.data[DOMAIN][entry.data[CONF_MAC]][CONF_ENTITY].manufacturer,
-        name=hass.data[DOMAIN][entry.data[CONF_MAC]][CONF_ENTITY].name,
-        model=hass.data[DOMAIN][entry.data[CONF_MAC]][CONF_ENTITY].model,
-        sw_version=hass.data[DOMAIN][entry.data[CONF_MAC]][CONF_ENTITY].firmware,
+        connections={(dr.CONNECTION_NETWORK_MAC, mac)},
+        identifiers={(DOMAIN, gateway.unique_id)},
+        manufacturer=gateway.manufacturer,
+        name=gateway.name,
+        model=gateway.model,
+        sw_version=gateway.firmware,
     )
 
     await hass.config_entries.async_forward_entry_setups(
-        entry, hass.data[DOMAIN][entry.data[CONF_MAC]][CONF_PLATFORMS].keys()
+        entry, gw_data[CONF_PLATFORMS].keys()
     )
 
     # Setup discovery config flow following OpenHAB patterns
     async_setup_discovery(hass)
     
     # Initialize discovery service following OpenHAB patterns
-    hass.data[DOMAIN][entry.data[CONF_MAC]][CONF_ENTITY].initialize_discovery_service()
+    gateway.initialize_discovery_service()
     
-    hass.data[DOMAIN][entry.data[CONF_MAC]][CONF_ENTITY].listening_worker = (
-        entry.async_create_background_task(
-            hass,
-            hass.data[DOMAIN][entry.data[CONF_MAC]][CONF_ENTITY].listening_loop(),
-            name="myhome_listening_worker",
-        )
+    gateway.listening_worker = entry.async_create_background_task(
+        hass,
+        gateway.listening_loop(),
+        name="myhome_listening_worker",
     )
     for i in range(_command_worker_count):
-        hass.data[DOMAIN][entry.data[CONF_MAC]][CONF_ENTITY].sending_workers.append(
+        gateway.sending_workers.append(
             entry.async_create_background_task(
                 hass,
-                hass.data[DOMAIN][entry.data[CONF_MAC]][CONF_ENTITY].sending_loop(i),
+                gateway.sending_loop(i),
                 name=f"myhome_sending_worker_{i}",
             )
         )
@@ -192,167 +390,39 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     entity_entries = er.async_entries_for_config_entry(entity_registry, entry.entry_id)
 
     entities_to_be_removed = []
-    devices_to_be_removed = [
+    devices_to_be_removed = {
         device_entry.id
-        for device_entry in device_registry.devices.values()
-        if entry.entry_id in device_entry.config_entries
-    ]
-
-    configured_entities = []
-
-    for _platform in hass.data[DOMAIN][entry.data[CONF_MAC]][CONF_PLATFORMS].keys():
-        for _device in hass.data[DOMAIN][entry.data[CONF_MAC]][CONF_PLATFORMS][
-            _platform
-        ].keys():
-            for _entity_name in hass.data[DOMAIN][entry.data[CONF_MAC]][CONF_PLATFORMS][
-                _platform
-            ][_device][CONF_ENTITIES]:
-                if _entity_name != _platform:
-                    configured_entities.append(
-                        f"{entry.data[CONF_MAC]}-{_device}-{_entity_name}"
-                    )  # extrapolating _attr_unique_id out of the entity's place in the config data structure
-                else:
-                    configured_entities.append(
-                        f"{entry.data[CONF_MAC]}-{_device}"
-                    )  # extrapolating _attr_unique_id out of the entity's place in the config data structure
+        for device_entry in dr.async_entries_for_config_entry(device_registry, entry.entry_id)
+    }
+
+    # Extrapolating _attr_unique_id out of the entity's place in the config data structure
+    configured_entities: set[str] = {
+        sys.intern(f"{mac}-{_device}" if _entity_name == _platform else f"{mac}-{_device}-{_entity_name}")
+        for _platform, _devices in gw_data[CONF_PLATFORMS].items()
+        for _device, _device_config in _devices.items()
+        for _entity_name in _device_config[CONF_ENTITIES]
+    }
 
     for entity_entry in entity_entries:
         if entity_entry.unique_id in configured_entities:
-            if entity_entry.device_id in devices_to_be_removed:
-                devices_to_be_removed.remove(entity_entry.device_id)
-            continue
-        entities_to_be_removed.append(entity_entry.entity_id)
+            devices_to_be_removed.discard(entity_entry.device_id)
+        else:
+            entities_to_be_removed.append(entity_entry.entity_id)
 
-    for enity_id in entities_to_be_removed:
-        entity_registry.async_remove(enity_id)
+    # Registry mutations happen in one pass once the registry is no longer being read
+    for entity_id in entities_to_be_removed:
+        entity_registry.async_remove(entity_id)
 
-    if gateway_device_entry.id in devices_to_be_removed:
-        devices_to_be_removed.remove(gateway_device_entry.id)
+    devices_to_be_removed.discard(gateway_device_entry.id)
 
+    # Single pass over the entity registry instead of one per candidate device
+    devices_with_entities = {
+        entity_entry.device_id for entity_entry in entity_registry.entities.values()
+    }
     for device_id in devices_to_be_removed:
-        if (
-            len(
-                er.async_entries_for_device(
-                    entity_registry, device_id, include_disabled_entities=True
-                )
-            )
-            == 0
-        ):
+        if device_id not in devices_with_entities:
             device_registry.async_remove_device(device_id)
 
-    # Defining the services
-    async def handle_sync_time(call):
-        gateway = call.data.get(ATTR_GATEWAY, None)
-        if gateway is None:
-            gateway = list(hass.data[DOMAIN].keys())[0]
-        else:
-            mac = format_mac(gateway)
-            if mac is None:
-                LOGGER.error(
-                    "Invalid gateway mac `%s`, could not send time synchronisation message.",
-                    gateway,
-                )
-                return False
-            else:
-                gateway = mac
-        timezone = hass.config.as_dict()["time_zone"]
-        if gateway in hass.data[DOMAIN]:
-            await hass.data[DOMAIN][gateway][CONF_ENTITY].send(
-                OWNGatewayCommand.set_datetime_to_now(timezone)
-            )
-        else:
-            LOGGER.error(
-                "Gateway `%s` not found, could not send time synchronisation message.",
-                gateway,
-            )
-            return False
-
-    hass.services.async_register(DOMAIN, "sync_time", handle_sync_time)
-
-    async def handle_send_message(call):
-        gateway = call.data.get(ATTR_GATEWAY, None)
-        message = call.data.get(ATTR_MESSAGE, None)
-        if gateway is None:
-            gateway = list(hass.data[DOMAIN].keys())[0]
-        else:
-            mac = format_mac(gateway)
-            if mac is None:
-                LOGGER.error(
-                    "Invalid gateway mac `%s`, could not send message `%s`.",
-                    gateway,
-                    message,
-                )
-                return False
-            else:
-                gateway = mac
-        LOGGER.debug("Handling message `%s` to be sent to `%s`", message, gateway)
-        if gateway in hass.data[DOMAIN]:
-            if message is not None:
-                own_message = OWNCommand.parse(message)
-                if own_message is not None:
-                    if own_message.is_valid:
-                        LOGGER.debug(
-                            "%s Sending valid OpenWebNet Message: `%s`",
-                            hass.data[DOMAIN][gateway][CONF_ENTITY].log_id,
-                            own_message,
-                        )
-                        await hass.data[DOMAIN][gateway][CONF_ENTITY].send(own_message)
-                else:
-                    LOGGER.error(
-                        "Could not parse message `%s`, not sending it.", message
-                    )
-                    return False
-        else:
-            LOGGER.error(
-                "Gateway `%s` not found, could not send message `%s`.", gateway, message
-            )
-            return False
-
-    hass.services.async_register(DOMAIN, "send_message", handle_send_message)
-
-    # Register discovery service following OpenHAB patterns
-    async def handle_start_discovery(call):
-        gateway = call.data.get(ATTR_GATEWAY, None)
-        if gateway is None:
-            gateway = list(hass.data[DOMAIN].keys())[0]
-        else:
-            mac = format_mac(gateway)
-            if mac is None:
-                LOGGER.error("Invalid gateway mac `%s`, could not start discovery.", gateway)
-                return False
-            else:
-                gateway = mac
-        
-        if gateway in hass.data[DOMAIN]:
-            await hass.data[DOMAIN][gateway][CONF_ENTITY].start_device_discovery()
-            LOGGER.info("Started device discovery on gateway %s", gateway)
-        else:
-            LOGGER.error("Gateway `%s` not found, could not start discovery.", gateway)
-            return False
-
-    hass.services.async_register(DOMAIN, "start_discovery", handle_start_discovery)
-
-    async def handle_stop_discovery(call):
-        gateway = call.data.get(ATTR_GATEWAY, None)
-        if gateway is None:
-            gateway = list(hass.data[DOMAIN].keys())[0]
-        else:
-            mac = format_mac(gateway)
-            if mac is None:
-                LOGGER.error("Invalid gateway mac `%s`, could not stop discovery.", gateway)
-                return False
-            else:
-                gateway = mac
-        
-        if gateway in hass.data[DOMAIN]:
-            await hass.data[DOMAIN][gateway][CONF_ENTITY].stop_device_discovery()
-            LOGGER.info("Stopped device discovery on gateway %s", gateway)
-        else:
-            LOGGER.error("Gateway `%s` not found, could not stop discovery.", gateway)
-            return False
-
-    hass.services.async_register(DOMAIN, "stop_discovery", handle_stop_discovery)
-
     return True
 
 
@@ -361,16 +431,18 @@ async def async_unload_entry(hass, entry):
 
     LOGGER.info("Unloading MyHome entry.")
 
+    mac = entry.data[CONF_MAC]
+    gw_data = hass.data[DOMAIN][mac]
+
     await hass.config_entries.async_unload_platforms(
-        entry, hass.data[DOMAIN][entry.data[CONF_MAC]][CONF_PLATFORMS].keys()
+        entry, gw_data[CONF_PLATFORMS].keys()
     )
 
-    hass.services.async_remove(DOMAIN, "sync_time")
-    hass.services.async_remove(DOMAIN, "send_message")
-    hass.services.async_remove(DOMAIN, "start_discovery")
-    hass.services.async_remove(DOMAIN, "stop_discovery")
+    gateway_handler = gw_data.pop(CONF_ENTITY)
+    del hass.data[DOMAIN][mac]
 
-    gateway_handler = hass.data[DOMAIN][entry.data[CONF_MAC]].pop(CONF_ENTITY)
-    del hass.data[DOMAIN][entry.data[CONF_MAC]]
+    # The discovery config flow is shared by all gateways, drop it with the last one
+    if all(key == "discovery" for key in hass.data[DOMAIN]):
+        async_unload_discovery(hass)
 
     return await gateway_handler.close_listener()
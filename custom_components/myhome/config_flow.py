@@ -38,6 +38,7 @@ from .const import (
     CONF_WORKER_COUNT,
     CONF_FILE_PATH,
     CONF_GENERATE_EVENTS,
+    DEFAULT_WORKER_COUNT,
     DOMAIN,
     LOGGER,
 )
@@ -238,7 +239,7 @@ class MyHomeConfigFlow(ConfigFlow, domain=DOMAIN):
                 CONF_UDN: gateway.udn,
             }
             _new_entry_options = {
-                CONF_WORKER_COUNT: self._existing_entry.options[CONF_WORKER_COUNT] if self._existing_entry and CONF_WORKER_COUNT in self._existing_entry.options else 1,
+                CONF_WORKER_COUNT: self._existing_entry.options[CONF_WORKER_COUNT] if self._existing_entry and CONF_WORKER_COUNT in self._existing_entry.options else DEFAULT_WORKER_COUNT,
             }
 
             if self._existing_entry:
@@ -369,7 +370,7 @@ class MyHomeOptionsFlowHandler(OptionsFlow):
         self.options = dict(config_entry.options)
         self.data = dict(config_entry.data)
         if CONF_WORKER_COUNT not in self.options:
-            self.options[CONF_WORKER_COUNT] = 1
+            self.options[CONF_WORKER_COUNT] = DEFAULT_WORKER_COUNT
         if CONF_FILE_PATH not in self.options:
             self.options[CONF_FILE_PATH] = "/config/myhome.yaml"
         if CONF_GENERATE_EVENTS not in self.options:
@@ -385,7 +386,7 @@ class MyHomeOptionsFlowHandler(OptionsFlow):
         errors = {}
 
         if user_input is not None:
-            if not os.path.isfile(user_input[CONF_FILE_PATH]):
+            if not await self.hass.async_add_executor_job(os.path.isfile, user_input[CONF_FILE_PATH]):
                 errors[CONF_FILE_PATH] = "invalid_config_path"
 
             self.options.update({CONF_WORKER_COUNT: user_input[CONF_WORKER_COUNT]})
@@ -1,17 +1,59 @@
 """Config flow discovery for MyHOME devices following OpenHAB patterns."""
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+import os
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, List, Mapping, Optional, Set, Tuple
 
-from homeassistant.core import HomeAssistant, callback
+import yaml
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .const import (
     DOMAIN,
+    EVENT_DEVICE_SUGGESTION,
+    EVENT_DEVICE_SUGGESTIONS,
+    EVENT_NOTIFY,
+    SIGNAL_DEVICES_DISCOVERED,
+    SIGNAL_DISCOVERY_COMPLETED,
     DEVICE_TYPE_TO_PLATFORM,
     ALL_DEVICE_SUPPORTED_TYPES,
+    DEVICE_TYPE_MODEL_LABEL,
+    SUGGESTED_CONFIG_TEMPLATES,
 )
-from .device_factory import MyHOMEDeviceFactory
+
+CONFIG_FILE_PATH = "/config/myhome.yaml"
+
+_EMPTY_DICT: Mapping[str, Any] = MappingProxyType({})
+
+# libyaml based loader and dumper when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _read_yaml(path: str) -> Dict[str, Any]:
+    """Read and parse a YAML file, in the executor."""
+    with open(path, encoding="utf-8") as yaml_file:
+        return yaml.load(yaml_file, Loader=_YAML_LOADER) or {}
+
+
+def _write_yaml_atomic(path: str, config: Dict[str, Any]) -> None:
+    """Dump config to a YAML file through a temporary file, in the executor."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as yaml_file:
+        yaml.dump(
+            config, yaml_file, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False
+        )
+    # Replace the file in one step so a crash never leaves a truncated config behind
+    os.replace(tmp_path, path)
+
+
+# Seconds to wait for more discovered devices before writing the config file
+CONFIG_FLUSH_DELAY = 1.0
 
 
 class MyHOMEDiscoveryConfigFlow:
@@ -21,6 +63,23 @@ class MyHOMEDiscoveryConfigFlow:
         """Initialize the discovery config flow."""
         self.hass = hass
         self.logger = logging.getLogger(__name__)
+        self._device_registry = dr.async_get(hass)
+        
+        # Unique ids already seen in the device registry, reset when a device is removed
+        self._configured_ids: Set[str] = set()
+        
+        # Unsubscribe callbacks of the bus listeners
+        self._unsubs: List[CALLBACK_TYPE] = []
+        
+        # Parsed myhome.yaml, only kept while it holds devices that are not written yet.
+        # Every other batch reads the file again, so edits made to it in the meantime
+        # are not overwritten. The lock is held while loading, while applying a batch
+        # of devices and while a flush writes the file, so a device is never lost
+        # between a read and a write.
+        self._config_cache: Optional[Dict[str, Any]] = None
+        self._config_dirty = False
+        self._config_lock = asyncio.Lock()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
         
         # Listen for discovery events
         self._setup_discovery_listeners()
@@ -28,337 +87,347 @@ class MyHOMEDiscoveryConfigFlow:
     @callback
     def _setup_discovery_listeners(self) -> None:
         """Setup discovery event listeners."""
-        self.hass.bus.async_listen(
-            f"{DOMAIN}_device_discovered", 
-            self._handle_device_discovered
-        )
+        # Discovery results are only consumed here, they go through the dispatcher
+        # rather than the event bus
+        self._unsubs.append(async_dispatcher_connect(
+            self.hass,
+            SIGNAL_DEVICES_DISCOVERED,
+            self._handle_devices_discovered
+        ))
         
-        self.hass.bus.async_listen(
-            f"{DOMAIN}_discovery_completed",
+        self._unsubs.append(async_dispatcher_connect(
+            self.hass,
+            SIGNAL_DISCOVERY_COMPLETED,
             self._handle_discovery_completed
-        )
+        ))
+        
+        self._unsubs.append(self.hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED,
+            self._handle_device_registry_updated
+        ))
     
     @callback
-    async def _handle_device_discovered(self, event) -> None:
-        """Handle device discovered event following OpenHAB patterns."""
-        try:
-            discovery_data = event.data
-            device_info = discovery_data.get("discovered_device")
-            
-            if not device_info:
-                return
-            
-            # Check if device is already configured
-            if await self._is_device_configured(device_info):
-                self.logger.debug("Device %s already configured, skipping", 
-                                device_info["unique_id"])
-                return
-            
-            # Create Home Assistant device registry entry
-            await self._create_device_registry_entry(device_info, discovery_data)
-            
-            # Suggest device configuration to user
-            await self._suggest_device_configuration(device_info, discovery_data)
-            
-        except Exception as e:
-            self.logger.error("Error handling device discovered event: %s", e)
+    def async_unload(self) -> None:
+        """Detach the discovery event listeners."""
+        while self._unsubs:
+            self._unsubs.pop()()
+        
+        # Do not lose devices added during the last flush delay
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+            self.hass.async_create_task(self._async_flush_config())
     
     @callback
-    async def _handle_discovery_completed(self, event) -> None:
-        """Handle discovery completion event."""
-        try:
-            data = event.data
-            gateway_mac = data.get("gateway_mac")
-            discovered_count = data.get("discovered_count", 0)
-            
-            self.logger.info(
-                "Discovery completed for gateway %s: %d devices found",
-                gateway_mac, discovered_count
-            )
-            
-            # Fire notification about discovery completion
-            self.hass.bus.async_fire(f"{DOMAIN}_notify", {
-                "title": "MyHOME Discovery Complete",
-                "message": f"Found {discovered_count} devices on gateway {gateway_mac}",
-                "notification_id": f"myhome_discovery_{gateway_mac}"
-            })
-            
-        except Exception as e:
-            self.logger.error("Error handling discovery completed event: %s", e)
+    def _handle_device_registry_updated(self, event) -> None:
+        """Forget cached configured devices when one is removed from the registry."""
+        if event.data.get("action") == "remove":
+            self._configured_ids.clear()
+    
+    async def _handle_devices_discovered(self, discovery_data: Dict[str, Any]) -> None:
+        """Handle a batch of discovered devices following OpenHAB patterns."""
+        config_entry_id = discovery_data.get("config_entry_id")
+        new_devices: List[Dict[str, Any]] = []
+        
+        for device_info in discovery_data.get("devices", ()):
+            try:
+                unique_id = device_info["unique_id"]
+                
+                # Check if device is already configured
+                if unique_id in self._configured_ids:
+                    self.logger.debug("Device %s already configured, skipping", unique_id)
+                    continue
+                
+                identifiers = frozenset({(DOMAIN, unique_id)})
+                device_entry = self._device_registry.async_get_device(identifiers=identifiers)
+                if device_entry is not None and config_entry_id in device_entry.config_entries:
+                    self._configured_ids.add(unique_id)
+                    self.logger.debug("Device %s already configured, skipping", unique_id)
+                    continue
+                
+                # Create Home Assistant device registry entry
+                await self._create_device_registry_entry(
+                    device_info, discovery_data, identifiers, device_entry
+                )
+                new_devices.append(device_info)
+                
+            except KeyError as e:
+                self.logger.error("Incomplete discovered device, missing %s", e)
+        
+        # Suggest device configuration to user
+        if new_devices:
+            await self._suggest_device_configurations(new_devices, discovery_data)
     
-    async def _is_device_configured(self, device_info: Dict[str, Any]) -> bool:
-        """Check if device is already configured."""
-        device_registry = dr.async_get(self.hass)
+    @callback
+    def _handle_discovery_completed(self, data: Dict[str, Any]) -> None:
+        """Handle discovery completion signal."""
+        gateway_mac = data.get("gateway_mac")
+        discovered_count = data.get("discovered_count", 0)
         
-        # Check by unique ID
-        device_entry = device_registry.async_get_device(
-            identifiers={(DOMAIN, device_info["unique_id"])}
+        self.logger.info(
+            "Discovery completed for gateway %s: %d devices found",
+            gateway_mac, discovered_count
         )
         
-        return device_entry is not None
+        # Fire notification about discovery completion
+        self.hass.bus.async_fire(EVENT_NOTIFY, {
+            "title": "MyHOME Discovery Complete",
+            "message": f"Found {discovered_count} devices on gateway {gateway_mac}",
+            "notification_id": f"myhome_discovery_{gateway_mac}"
+        })
     
     async def _create_device_registry_entry(
         self, 
         device_info: Dict[str, Any], 
-        discovery_data: Dict[str, Any]
+        discovery_data: Dict[str, Any],
+        identifiers: FrozenSet[Tuple[str, str]],
+        device_entry: Optional[dr.DeviceEntry] = None
     ) -> None:
         """Create device registry entry following OpenHAB patterns."""
         try:
-            device_registry = dr.async_get(self.hass)
             config_entry_id = discovery_data.get("config_entry_id")
             gateway_mac = discovery_data.get("gateway_mac")
+            properties = device_info.get("properties") or _EMPTY_DICT
+            
+            # Device known from another gateway entry, only link it to this one
+            if device_entry is not None:
+                self._device_registry.async_update_device(
+                    device_entry.id, add_config_entry_id=config_entry_id
+                )
+                self.logger.debug("Linked device registry entry for %s", device_info["name"])
+                return
             
             # Create device entry
-            device_entry = device_registry.async_get_or_create(
+            device_entry = self._device_registry.async_get_or_create(
                 config_entry_id=config_entry_id,
-                identifiers={(DOMAIN, device_info["unique_id"])},
+                identifiers=identifiers,
                 manufacturer="BTicino/Legrand",
                 name=device_info["name"],
-                model=f"MyHOME {device_info['device_type'].replace('_', ' ').title()}",
+                model=DEVICE_TYPE_MODEL_LABEL[device_info["device_type"]],
                 via_device=(DOMAIN, gateway_mac),
-                sw_version=device_info["properties"].get("firmware_version"),
+                sw_version=properties.get("firmware_version"),
             )
             
             self.logger.debug("Created device registry entry for %s", device_info["name"])
             
-        except Exception as e:
+        except HomeAssistantError as e:
             self.logger.error("Error creating device registry entry: %s", e)
     
-    async def _suggest_device_configuration(
+    async def _suggest_device_configurations(
         self, 
-        device_info: Dict[str, Any],
+        devices: List[Dict[str, Any]],
         discovery_data: Dict[str, Any]
     ) -> None:
         """Suggest device configuration to user following OpenHAB patterns."""
-        try:
-            self.logger.debug("Starting device configuration suggestion for %s", device_info["name"])
-            self.logger.debug("Device info for suggestion: %s", device_info)
-            
-            # Generate suggested configuration
-            suggested_config = self._generate_suggested_config(device_info)
-            self.logger.debug("Generated suggested config: %s", suggested_config)
-            
-            # Auto-add device to configuration for now (can be made optional later)
+        suggestions = []
+        for device_info in devices:
             try:
-                self.logger.debug("Attempting to add device to config file...")
-                await self._add_device_to_config(device_info, suggested_config, discovery_data)
-                self.logger.info("Auto-added discovered device %s to configuration", device_info["name"])
-            except Exception as config_error:
-                self.logger.error("Failed to add device to config file: %s", config_error)
-                self.logger.debug("Config error details - device: %s, config: %s", device_info["name"], suggested_config)
-                # Continue with other processing even if config write fails
-            
-            # Also fire event for UI to handle if needed
-            config_data = {
+                suggestions.append((device_info, self._generate_suggested_config(device_info)))
+            except KeyError as e:
+                self.logger.error(
+                    "Error suggesting device configuration for %s: %s",
+                    device_info.get("name", "unknown"), e
+                )
+        
+        # Auto-add devices to configuration for now (can be made optional later),
+        # failures are logged there and do not stop the suggestion events
+        await self._add_devices_to_config(suggestions, discovery_data)
+        
+        if not suggestions:
+            return
+        
+        # Also fire events for UI to handle if needed, one for the whole batch
+        config_entry_id = discovery_data.get("config_entry_id")
+        gateway_mac = discovery_data.get("gateway_mac")
+        events = [
+            {
                 "device_info": device_info,
-                "discovery_data": discovery_data,
+                "discovery_data": {
+                    "platform": device_info.get("platform"),
+                    "config_entry_id": config_entry_id,
+                    "gateway_mac": gateway_mac,
+                },
                 "suggested_config": suggested_config
             }
-            self.logger.debug("Firing device suggestion event with data: %s", config_data)
-            self.hass.bus.async_fire(f"{DOMAIN}_device_suggestion", config_data)
-            self.logger.debug("Device suggestion event fired successfully")
-            
-        except Exception as e:
-            self.logger.error("Error suggesting device configuration for %s: %s", device_info.get("name", "unknown"), e)
-            self.logger.debug("Full error context - device_info: %s, discovery_data: %s", device_info, discovery_data)
+            for device_info, suggested_config in suggestions
+        ]
+        self.hass.bus.async_fire(EVENT_DEVICE_SUGGESTIONS, {
+            "config_entry_id": config_entry_id,
+            "gateway_mac": gateway_mac,
+            "suggestions": events,
+        })
+        
+        # Listeners of all events, such as the recorder, also expect the per device events
+        for event_data in events:
+            self.hass.bus.async_fire(EVENT_DEVICE_SUGGESTION, event_data)
+    
+    async def _load_config(self) -> Dict[str, Any]:
+        """Return the configuration, reading the YAML file unless a flush is pending."""
+        # Devices added by earlier batches of the burst are not on disk yet
+        if self._config_dirty:
+            return self._config_cache
+        
+        try:
+            self._config_cache = await self.hass.async_add_executor_job(
+                _read_yaml, CONFIG_FILE_PATH
+            )
+        except FileNotFoundError:
+            self.logger.info("Config file not found, creating new config structure")
+            self._config_cache = {}
+        
+        return self._config_cache
+    
+    async def _flush_config(self) -> None:
+        """Write the cached configuration to disk if it changed."""
+        if not self._config_dirty:
+            return
+        
+        # Only mutated under the config lock, which the caller holds during the write
+        await self.hass.async_add_executor_job(
+            _write_yaml_atomic, CONFIG_FILE_PATH, self._config_cache
+        )
+        self._config_dirty = False
+        # The next batch reads the file again, it may be edited until then
+        self._config_cache = None
+        
+        self.logger.debug("Wrote configuration to %s", CONFIG_FILE_PATH)
     
-    async def _add_device_to_config(
+    @callback
+    def _schedule_flush(self) -> None:
+        """Write the config file once the current burst of discoveries is over."""
+        if self._flush_handle is not None:
+            return
+        self._flush_handle = self.hass.loop.call_later(
+            CONFIG_FLUSH_DELAY,
+            lambda: self.hass.async_create_task(self._async_flush_config()),
+        )
+    
+    async def _async_flush_config(self) -> None:
+        """Flush the cached configuration scheduled by _schedule_flush."""
+        self._flush_handle = None
+        async with self._config_lock:
+            try:
+                await self._flush_config()
+            except (OSError, yaml.YAMLError) as write_error:
+                self.logger.error("Error writing to config file: %s", write_error)
+    
+    async def _add_devices_to_config(
         self, 
-        device_info: Dict[str, Any], 
-        suggested_config: Dict[str, Any],
+        suggestions: List[Tuple[Dict[str, Any], Dict[str, Any]]],
         discovery_data: Dict[str, Any]
     ) -> None:
-        """Add discovered device to YAML configuration."""
-        try:
-            import yaml
-            import aiofiles
-            import os
-            
-            gateway_mac = discovery_data["gateway_mac"]
-            platform = device_info["platform"]
-            where = device_info["where"]
-            
-            # Use device WHERE as config key, make it unique
-            device_key = f"discovered_{where}"
-            
-            config_file_path = "/config/myhome.yaml"
-            
-            self.logger.debug("Starting config file write process for device %s", device_info["name"])
-            self.logger.debug("Config file path: %s", config_file_path)
-            self.logger.debug("Gateway MAC: %s, Platform: %s, WHERE: %s", gateway_mac, platform, where)
-            self.logger.debug("Device key: %s", device_key)
-            self.logger.debug("Suggested config: %s", suggested_config)
-            
-            # Read existing config
+        """Add discovered devices to YAML configuration."""
+        if not suggestions:
+            return
+        
+        logger = self.logger
+        debug = logger.isEnabledFor(logging.DEBUG)
+        gateway_mac = discovery_data.get("gateway_mac")
+        added = 0
+        
+        async with self._config_lock:
             try:
-                self.logger.debug("Reading existing config file...")
-                async with aiofiles.open(config_file_path, mode="r") as yaml_file:
-                    content = await yaml_file.read()
-                    self.logger.debug("Config file content length: %d chars", len(content))
-                    config = yaml.safe_load(content) or {}
-                    self.logger.debug("Parsed existing config: %s", config)
-            except FileNotFoundError:
-                self.logger.info("Config file not found, creating new config structure")
-                config = {}
-            except Exception as e:
-                self.logger.error("Error reading config file: %s", e)
-                raise
-            
-            # Initialize gateway config if needed (use "gateway" as key instead of MAC)
-            if "gateway" not in config:
-                self.logger.debug("Initializing gateway config structure")
-                config["gateway"] = {"mac": gateway_mac}
-            else:
-                self.logger.debug("Gateway config exists: %s", config["gateway"])
-            
-            # Initialize platform if needed  
-            if platform not in config["gateway"]:
-                self.logger.debug("Initializing platform %s in gateway config", platform)
-                config["gateway"][platform] = {}
-            else:
-                self.logger.debug("Platform %s exists with %d devices", platform, len(config["gateway"][platform]))
-            
-            # Check if device already exists
-            if device_key in config["gateway"][platform]:
-                self.logger.warning("Device %s already exists in config, overwriting", device_key)
-            else:
-                self.logger.debug("Adding new device %s to platform %s", device_key, platform)
-            
-            # Add device config
-            config["gateway"][platform][device_key] = suggested_config
-            
-            self.logger.debug("Device added to config structure")
-            self.logger.debug("Updated platform config: %s", config["gateway"][platform])
-            self.logger.debug("Full config structure keys: %s", list(config.keys()))
+                config = await self._load_config()
+            except (OSError, yaml.YAMLError) as e:
+                logger.error("Error reading config file: %s", e)
+                return
             
-            # Write back to file
-            try:
-                self.logger.debug("Writing updated config to file...")
-                async with aiofiles.open(config_file_path, mode="w") as yaml_file:
-                    yaml_content = yaml.dump(config, default_flow_style=False, sort_keys=False)
-                    self.logger.debug("Generated YAML content length: %d chars", len(yaml_content))
-                    await yaml_file.write(yaml_content)
-                    self.logger.debug("Config file write completed successfully")
-                
-                self.logger.info("Successfully added device %s to configuration file at %s", device_info["name"], config_file_path)
-                
-                # Log file stats for verification
+            for device_info, suggested_config in suggestions:
                 try:
-                    file_stat = os.stat(config_file_path)
-                    self.logger.debug("Config file size after write: %d bytes", file_stat.st_size)
-                except Exception as stat_error:
-                    self.logger.debug("Could not get file stats: %s", stat_error)
-                
-            except Exception as write_error:
-                self.logger.error("Error writing to config file: %s", write_error)
-                raise
-            
-            # Trigger config reload by reloading the integration
-            self.logger.info("Config file updated, integration will reload automatically on next restart")
-            self.logger.debug("To reload immediately, restart the MyHOME integration or Home Assistant")
-            # Note: Don't force reload here as it can cause race conditions during discovery
-            # The integration will pick up changes on next restart or manual reload
-            
-        except Exception as e:
-            self.logger.error("Error in config file write process for device %s: %s", device_info["name"], e)
-            self.logger.debug("Device info: %s", device_info)
-            self.logger.debug("Suggested config: %s", suggested_config)
-            self.logger.debug("Discovery data: %s", discovery_data)
+                    platform = device_info["platform"]
+                    
+                    # Use device WHERE as config key, make it unique
+                    device_key = f"discovered_{device_info['where']}"
+                    
+                    if debug:
+                        logger.debug(
+                            "Adding device %s as %s to platform %s of gateway %s: %s",
+                            device_info["name"], device_key, platform, gateway_mac, suggested_config
+                        )
+                    
+                    # Initialize gateway config if needed (use "gateway" as key instead of MAC)
+                    if "gateway" not in config:
+                        if debug:
+                            logger.debug("Initializing gateway config structure")
+                        config["gateway"] = {"mac": gateway_mac}
+                    
+                    # Initialize platform if needed  
+                    if platform not in config["gateway"]:
+                        if debug:
+                            logger.debug("Initializing platform %s in gateway config", platform)
+                        config["gateway"][platform] = {}
+                    
+                    # Check if device already exists
+                    if device_key in config["gateway"][platform]:
+                        logger.warning("Device %s already exists in config, overwriting", device_key)
+                    
+                    # Add device config
+                    config["gateway"][platform][device_key] = suggested_config
+                    self._config_dirty = True
+                    added += 1
+                    
+                except (KeyError, TypeError) as e:
+                    # Missing device fields, or a gateway/platform section that is not a mapping
+                    logger.error(
+                        "Error in config file write process for device %s: %s",
+                        device_info.get("name", "unknown"), e
+                    )
+                    if debug:
+                        logger.debug(
+                            "Device info: %s, suggested config: %s, discovery data: %s",
+                            device_info, suggested_config, discovery_data
+                        )
+        
+        if not added:
+            return
+        
+        # Write back to file, coalescing the devices of a discovery burst
+        self._schedule_flush()
+        
+        logger.info("Added %d devices to configuration file at %s", added, CONFIG_FILE_PATH)
+        
+        # Trigger config reload by reloading the integration
+        logger.info("Config file updated, integration will reload automatically on next restart")
+        # Note: Don't force reload here as it can cause race conditions during discovery
+        # The integration will pick up changes on next restart or manual reload
     
     def _generate_suggested_config(self, device_info: Dict[str, Any]) -> Dict[str, Any]:
         """Generate suggested configuration following OpenHAB patterns."""
         device_type = device_info["device_type"]
-        platform = device_info["platform"]
-        where = device_info["where"]
-        name = device_info["name"]
-        
-        self.logger.debug("Generating config for device type: %s, platform: %s, where: %s, name: %s", 
-                         device_type, platform, where, name)
         
         # Base configuration - only include valid schema fields
         suggested_config = {
-            "where": where,
-            "name": name,
+            "where": device_info["where"],
+            "name": device_info["name"],
         }
         
-        self.logger.debug("Base suggested_config: %s", suggested_config)
-        
         # Add device-specific configuration following OpenHAB patterns
-        if device_type in ["bus_dimmer", "bus_on_off_switch"]:
-            self.logger.debug("Configuring lighting device: %s", device_type)
-            suggested_config.update({
-                "dimmable": device_type == "bus_dimmer",
-                "icon": "mdi:lightbulb" if device_type == "bus_dimmer" else "mdi:light-switch"
-            })
-        
-        elif device_type == "bus_automation":
-            self.logger.debug("Configuring automation device")
-            suggested_config.update({
-                "device_class": "shutter",
-                "icon": "mdi:window-shutter",
-                "shutter_run": 20  # Default run time in seconds
-            })
-        
-        elif device_type == "bus_energy_meter":
-            self.logger.debug("Configuring energy meter device")
-            suggested_config.update({
-                "device_class": "energy",
-                "unit_of_measurement": "W",
-                "icon": "mdi:flash",
-                "refresh_period": 30
-            })
-        
-        elif device_type in ["bus_thermo_zone", "bus_thermo_sensor"]:
-            self.logger.debug("Configuring thermo device: %s", device_type)
-            suggested_config.update({
-                "device_class": "temperature",
-                "unit_of_measurement": "°C",
-                "icon": "mdi:thermometer",
-                "standalone": device_type == "bus_thermo_sensor"
-            })
-        
-        elif device_type in ["bus_cen_scenario_control", "bus_cenplus_scenario_control"]:
-            self.logger.debug("Configuring scenario control device: %s", device_type)
-            suggested_config.update({
-                "device_class": "button",
-                "icon": "mdi:gesture-tap-button",
-                "buttons": "1,2,3,4"  # Default button configuration
-            })
-        
-        elif device_type == "bus_dry_contact_ir":
-            self.logger.debug("Configuring dry contact device")
-            suggested_config.update({
-                "device_class": "motion",
-                "icon": "mdi:motion-sensor"
-            })
-        
-        elif device_type == "bus_aux":
-            self.logger.debug("Configuring auxiliary device")
-            suggested_config.update({
-                "device_class": "switch",
-                "icon": "mdi:electric-switch"
-            })
-        
-        elif device_type in ["bus_alarm_system", "bus_alarm_zone"]:
-            self.logger.debug("Configuring alarm device: %s", device_type)
-            suggested_config.update({
-                "device_class": "safety",
-                "icon": "mdi:shield-home"
-            })
-        
+        device_specific_config = SUGGESTED_CONFIG_TEMPLATES.get(device_type)
+        if device_specific_config is not None:
+            suggested_config.update(device_specific_config)
         else:
             self.logger.warning("Unknown device type %s, using basic configuration", device_type)
         
-        self.logger.debug("Final suggested_config for %s: %s", device_type, suggested_config)
         return suggested_config
 
-
 @callback
 def async_setup_discovery(hass: HomeAssistant) -> None:
     """Setup discovery config flow following OpenHAB patterns."""
+    # A single instance serves every gateway, it listens to the events of all of them
+    if "discovery" in hass.data.get(DOMAIN, {}):
+        return
+    
     discovery = MyHOMEDiscoveryConfigFlow(hass)
     
     # Store reference for cleanup
     if DOMAIN not in hass.data:
         hass.data[DOMAIN] = {}
-    hass.data[DOMAIN]["discovery"] = discovery
\ No newline at end of file
+    hass.data[DOMAIN]["discovery"] = discovery
+
+
+@callback
+def async_unload_discovery(hass: HomeAssistant) -> None:
+    """Tear down the discovery config flow set up by async_setup_discovery."""
+    discovery = hass.data.get(DOMAIN, {}).pop("discovery", None)
+    if discovery is not None:
+        discovery.async_unload()
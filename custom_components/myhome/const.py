@@ -1,6 +1,7 @@
 """Constants for the MyHome component."""
 import logging
-from typing import Dict, Set
+from types import MappingProxyType
+from typing import Any, FrozenSet, Mapping
 
 LOGGER = logging.getLogger(__package__)
 DOMAIN = "myhome"
@@ -12,6 +13,13 @@ THING_STATE_REQ_TIMEOUT_SEC = 5
 ATTR_GATEWAY = "gateway"
 ATTR_MESSAGE = "message"
 
+# Discovery events and dispatcher signals
+EVENT_DEVICE_SUGGESTION = f"{DOMAIN}_device_suggestion"
+EVENT_DEVICE_SUGGESTIONS = f"{DOMAIN}_device_suggestions"
+EVENT_NOTIFY = f"{DOMAIN}_notify"
+SIGNAL_DEVICES_DISCOVERED = f"{DOMAIN}_devices_discovered"
+SIGNAL_DISCOVERY_COMPLETED = f"{DOMAIN}_discovery_completed"
+
 # Configuration constants
 CONF = "config"
 CONF_ENTITY = "entity"
@@ -31,6 +39,9 @@ CONF_MANUFACTURER = "manufacturer"
 CONF_MANUFACTURER_URL = "manufacturerURL"
 CONF_UDN = "UDN"
 CONF_WORKER_COUNT = "command_worker_count"
+# Every worker opens its own command session, gateways only allow a few at a time
+# and commands from several workers can reach the bus out of order
+DEFAULT_WORKER_COUNT = 1
 CONF_FILE_PATH = "config_file_path"
 CONF_GENERATE_EVENTS = "generate_events"
 CONF_PARENT_ID = "parent_id"
@@ -72,42 +83,42 @@ DEVICE_TYPE_BUS_ALARM_ZONE = "bus_alarm_zone"
 DEVICE_TYPE_BUS_AUX = "bus_aux"
 
 # Supported device type sets (following OpenHAB pattern)
-GENERIC_SUPPORTED_DEVICE_TYPES: Set[str] = {DEVICE_TYPE_GENERIC}
+GENERIC_SUPPORTED_DEVICE_TYPES: FrozenSet[str] = frozenset({DEVICE_TYPE_GENERIC})
 
-LIGHTING_SUPPORTED_DEVICE_TYPES: Set[str] = {
+LIGHTING_SUPPORTED_DEVICE_TYPES: FrozenSet[str] = frozenset({
     DEVICE_TYPE_BUS_ON_OFF_SWITCH,
     DEVICE_TYPE_BUS_DIMMER
-}
+})
 
-LIGHTING_GROUP_SUPPORTED_DEVICE_TYPES: Set[str] = {DEVICE_TYPE_BUS_LIGHT_GROUP}
+LIGHTING_GROUP_SUPPORTED_DEVICE_TYPES: FrozenSet[str] = frozenset({DEVICE_TYPE_BUS_LIGHT_GROUP})
 
-AUTOMATION_SUPPORTED_DEVICE_TYPES: Set[str] = {DEVICE_TYPE_BUS_AUTOMATION}
+AUTOMATION_SUPPORTED_DEVICE_TYPES: FrozenSet[str] = frozenset({DEVICE_TYPE_BUS_AUTOMATION})
 
-THERMOREGULATION_SUPPORTED_DEVICE_TYPES: Set[str] = {
+THERMOREGULATION_SUPPORTED_DEVICE_TYPES: FrozenSet[str] = frozenset({
     DEVICE_TYPE_BUS_THERMO_ZONE,
     DEVICE_TYPE_BUS_THERMO_SENSOR,
     DEVICE_TYPE_BUS_THERMO_CU
-}
+})
 
-ENERGY_MANAGEMENT_SUPPORTED_DEVICE_TYPES: Set[str] = {DEVICE_TYPE_BUS_ENERGY_METER}
+ENERGY_MANAGEMENT_SUPPORTED_DEVICE_TYPES: FrozenSet[str] = frozenset({DEVICE_TYPE_BUS_ENERGY_METER})
 
-SCENARIO_SUPPORTED_DEVICE_TYPES: Set[str] = {
+SCENARIO_SUPPORTED_DEVICE_TYPES: FrozenSet[str] = frozenset({
     DEVICE_TYPE_BUS_CEN_SCENARIO_CONTROL,
     DEVICE_TYPE_BUS_CENPLUS_SCENARIO_CONTROL,
     DEVICE_TYPE_BUS_DRY_CONTACT_IR
-}
+})
 
-SCENARIO_BASIC_SUPPORTED_DEVICE_TYPES: Set[str] = {DEVICE_TYPE_BUS_SCENARIO}
+SCENARIO_BASIC_SUPPORTED_DEVICE_TYPES: FrozenSet[str] = frozenset({DEVICE_TYPE_BUS_SCENARIO})
 
-AUX_SUPPORTED_DEVICE_TYPES: Set[str] = {DEVICE_TYPE_BUS_AUX}
+AUX_SUPPORTED_DEVICE_TYPES: FrozenSet[str] = frozenset({DEVICE_TYPE_BUS_AUX})
 
-ALARM_SUPPORTED_DEVICE_TYPES: Set[str] = {
+ALARM_SUPPORTED_DEVICE_TYPES: FrozenSet[str] = frozenset({
     DEVICE_TYPE_BUS_ALARM_SYSTEM,
     DEVICE_TYPE_BUS_ALARM_ZONE
-}
+})
 
 # Combined device type sets
-ALL_DEVICE_SUPPORTED_TYPES: Set[str] = (
+ALL_DEVICE_SUPPORTED_TYPES: FrozenSet[str] = (
     GENERIC_SUPPORTED_DEVICE_TYPES |
     LIGHTING_SUPPORTED_DEVICE_TYPES |
     LIGHTING_GROUP_SUPPORTED_DEVICE_TYPES |
@@ -121,7 +132,7 @@ ALL_DEVICE_SUPPORTED_TYPES: Set[str] = (
 )
 
 # Device type to platform mapping
-DEVICE_TYPE_TO_PLATFORM: Dict[str, str] = {
+DEVICE_TYPE_TO_PLATFORM: Mapping[str, str] = MappingProxyType({
     DEVICE_TYPE_BUS_ON_OFF_SWITCH: "light",
     DEVICE_TYPE_BUS_DIMMER: "light",
     DEVICE_TYPE_BUS_LIGHT_GROUP: "light",
@@ -138,7 +149,75 @@ DEVICE_TYPE_TO_PLATFORM: Dict[str, str] = {
     DEVICE_TYPE_BUS_ALARM_ZONE: "binary_sensor",
     DEVICE_TYPE_BUS_AUX: "switch",
     DEVICE_TYPE_GENERIC: "sensor"
-}
+})
+
+# Device registry model name of each device type
+DEVICE_TYPE_MODEL_LABEL: Mapping[str, str] = MappingProxyType({
+    device_type: f"MyHOME {device_type.replace('_', ' ').title()}"
+    for device_type in ALL_DEVICE_SUPPORTED_TYPES
+})
+
+# Device-specific part of the suggested configuration of discovered devices
+SUGGESTED_CONFIG_TEMPLATES: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    DEVICE_TYPE_BUS_DIMMER: MappingProxyType({
+        "dimmable": True,
+        "icon": "mdi:lightbulb",
+    }),
+    DEVICE_TYPE_BUS_ON_OFF_SWITCH: MappingProxyType({
+        "dimmable": False,
+        "icon": "mdi:light-switch",
+    }),
+    DEVICE_TYPE_BUS_AUTOMATION: MappingProxyType({
+        "device_class": "shutter",
+        "icon": "mdi:window-shutter",
+        "shutter_run": 20,  # Default run time in seconds
+    }),
+    DEVICE_TYPE_BUS_ENERGY_METER: MappingProxyType({
+        "device_class": "energy",
+        "unit_of_measurement": "W",
+        "icon": "mdi:flash",
+        "refresh_period": 30,
+    }),
+    DEVICE_TYPE_BUS_THERMO_ZONE: MappingProxyType({
+        "device_class": "temperature",
+        "unit_of_measurement": "°C",
+        "icon": "mdi:thermometer",
+        "standalone": False,
+    }),
+    DEVICE_TYPE_BUS_THERMO_SENSOR: MappingProxyType({
+        "device_class": "temperature",
+        "unit_of_measurement": "°C",
+        "icon": "mdi:thermometer",
+        "standalone": True,
+    }),
+    DEVICE_TYPE_BUS_CEN_SCENARIO_CONTROL: MappingProxyType({
+        "device_class": "button",
+        "icon": "mdi:gesture-tap-button",
+        "buttons": "1,2,3,4",  # Default button configuration
+    }),
+    DEVICE_TYPE_BUS_CENPLUS_SCENARIO_CONTROL: MappingProxyType({
+        "device_class": "button",
+        "icon": "mdi:gesture-tap-button",
+        "buttons": "1,2,3,4",  # Default button configuration
+    }),
+    DEVICE_TYPE_BUS_DRY_CONTACT_IR: MappingProxyType({
+        "device_class": "motion",
+        "icon": "mdi:motion-sensor",
+    }),
+    DEVICE_TYPE_BUS_AUX: MappingProxyType({
+        "device_class": "switch",
+        "icon": "mdi:electric-switch",
+    }),
+    DEVICE_TYPE_BUS_ALARM_SYSTEM: MappingProxyType({
+        "device_class": "safety",
+        "icon": "mdi:shield-home",
+    }),
+    DEVICE_TYPE_BUS_ALARM_ZONE: MappingProxyType({
+        "device_class": "safety",
+        "icon": "mdi:shield-home",
+    }),
+})
+
 
 # Channel constants (following OpenHAB pattern)
 CHANNEL_SWITCH = "switch"
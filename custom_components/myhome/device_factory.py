@@ -1,7 +1,10 @@
 """Device handler factory for MyHOME integration following OpenHAB patterns."""
 
-from typing import Optional, Dict, Any
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Optional, Dict, Any, FrozenSet, Mapping
 import logging
+import sys
 
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
@@ -20,6 +23,64 @@ from .const import (
     ALARM_SUPPORTED_DEVICE_TYPES,
     GENERIC_SUPPORTED_DEVICE_TYPES,
 )
+from .device_handler import (
+    MyHOMELightingHandler,
+    MyHOMEAutomationHandler,
+    MyHOMEThermoregulationHandler,
+    MyHOMEEnergyHandler,
+    MyHOMEScenarioHandler,
+    MyHOMEAlarmHandler,
+    MyHOMEAuxiliaryHandler,
+    MyHOMEGenericHandler,
+)
+
+# Fields every device configuration must have
+_REQUIRED_FIELDS: FrozenSet[str] = frozenset(("where", "name"))
+
+# Category of every supported device type (following OpenHAB pattern)
+_CATEGORY_MAP: Mapping[str, str] = MappingProxyType({
+    device_type: category
+    for device_types, category in (
+        (LIGHTING_SUPPORTED_DEVICE_TYPES, "lighting"),
+        (LIGHTING_GROUP_SUPPORTED_DEVICE_TYPES, "lighting_group"),
+        (AUTOMATION_SUPPORTED_DEVICE_TYPES, "automation"),
+        (THERMOREGULATION_SUPPORTED_DEVICE_TYPES, "thermoregulation"),
+        (ENERGY_MANAGEMENT_SUPPORTED_DEVICE_TYPES, "energy_management"),
+        (SCENARIO_SUPPORTED_DEVICE_TYPES, "scenario"),
+        (SCENARIO_BASIC_SUPPORTED_DEVICE_TYPES, "scenario_basic"),
+        (AUX_SUPPORTED_DEVICE_TYPES, "auxiliary"),
+        (ALARM_SUPPORTED_DEVICE_TYPES, "alarm"),
+        (GENERIC_SUPPORTED_DEVICE_TYPES, "generic"),
+    )
+    for device_type in device_types
+})
+
+# Device types of every Home Assistant platform
+_PLATFORM_TO_TYPES: Mapping[str, FrozenSet[str]] = MappingProxyType({
+    platform: frozenset(
+        device_type
+        for device_type, device_platform in DEVICE_TYPE_TO_PLATFORM.items()
+        if device_platform == platform
+    )
+    for platform in set(DEVICE_TYPE_TO_PLATFORM.values())
+})
+
+# Handler class of every supported device type (following OpenHAB factory pattern)
+_HANDLER_MAP: Mapping[str, type] = MappingProxyType({
+    device_type: handler_class
+    for handler_class in (
+        MyHOMELightingHandler,
+        MyHOMEAutomationHandler,
+        MyHOMEThermoregulationHandler,
+        MyHOMEEnergyHandler,
+        MyHOMEScenarioHandler,
+        MyHOMEAlarmHandler,
+        MyHOMEAuxiliaryHandler,
+        MyHOMEGenericHandler,
+    )
+    for device_type in handler_class.SUPPORTED_DEVICE_TYPES
+})
+
 
 class MyHOMEDeviceFactory:
     """Factory for creating MyHOME device handlers following OpenHAB patterns."""
@@ -40,40 +101,22 @@ class MyHOMEDeviceFactory:
     
     def get_device_category(self, device_type: str) -> str:
         """Get device category based on device type (following OpenHAB pattern)."""
-        if device_type in LIGHTING_SUPPORTED_DEVICE_TYPES:
-            return "lighting"
-        elif device_type in LIGHTING_GROUP_SUPPORTED_DEVICE_TYPES:
-            return "lighting_group"
-        elif device_type in AUTOMATION_SUPPORTED_DEVICE_TYPES:
-            return "automation"
-        elif device_type in THERMOREGULATION_SUPPORTED_DEVICE_TYPES:
-            return "thermoregulation"
-        elif device_type in ENERGY_MANAGEMENT_SUPPORTED_DEVICE_TYPES:
-            return "energy_management"
-        elif device_type in SCENARIO_SUPPORTED_DEVICE_TYPES:
-            return "scenario"
-        elif device_type in SCENARIO_BASIC_SUPPORTED_DEVICE_TYPES:
-            return "scenario_basic"
-        elif device_type in AUX_SUPPORTED_DEVICE_TYPES:
-            return "auxiliary"
-        elif device_type in ALARM_SUPPORTED_DEVICE_TYPES:
-            return "alarm"
-        elif device_type in GENERIC_SUPPORTED_DEVICE_TYPES:
-            return "generic"
-        else:
-            return "unknown"
+        return _CATEGORY_MAP.get(device_type, "unknown")
     
     def create_device_config(self, device_type: str, device_config: Dict[str, Any]) -> Dict[str, Any]:
         """Create standardized device configuration following OpenHAB patterns."""
-        category = self.get_device_category(device_type)
-        platform = self.get_platform_for_device_type(device_type)
+        # Stored device types share the string objects keying the lookup tables
+        device_type = sys.intern(device_type)
+        category = _CATEGORY_MAP.get(device_type, "unknown")
+        platform = DEVICE_TYPE_TO_PLATFORM.get(device_type)
         
         standardized_config = {
             "device_type": device_type,
             "category": category,
             "platform": platform,
-            **device_config
         }
+        # Values given in the device config keep precedence
+        standardized_config.update(device_config)
         
         self.logger.debug(
             "Created device config for type %s: category=%s, platform=%s", 
@@ -86,88 +129,54 @@ class MyHOMEDeviceFactory:
         self, devices_config: Dict[str, Any]
     ) -> Dict[str, Dict[str, Any]]:
         """Organize devices by category following OpenHAB patterns."""
-        organized = {}
+        organized = defaultdict(dict)
+        category_of = _CATEGORY_MAP.get
         
         for device_id, device_config in devices_config.items():
-            device_type = device_config.get("device_type", "generic_device")
-            category = self.get_device_category(device_type)
-            
-            if category not in organized:
-                organized[category] = {}
-            
-            organized[category][device_id] = device_config
+            device_type = sys.intern(device_config.get("device_type", "generic_device"))
+            organized[category_of(device_type, "unknown")][device_id] = device_config
         
-        return organized
+        return dict(organized)
     
     def validate_device_config(
         self, device_type: str, device_config: Dict[str, Any]
     ) -> bool:
         """Validate device configuration."""
-        if not self.supports_device_type(device_type):
+        device_type = sys.intern(device_type)
+        if device_type not in ALL_DEVICE_SUPPORTED_TYPES:
             self.logger.error("Unsupported device type: %s", device_type)
             return False
         
         # Basic validation - ensure required fields are present
-        required_fields = ["where", "name"]
-        for field in required_fields:
-            if field not in device_config:
-                self.logger.error(
-                    "Missing required field '%s' for device type %s", 
-                    field, device_type
-                )
-                return False
+        missing_fields = _REQUIRED_FIELDS.difference(device_config)
+        if missing_fields:
+            self.logger.error(
+                "Missing required fields %s for device type %s", 
+                ", ".join(sorted(missing_fields)), device_type
+            )
+            return False
         
         return True
     
-    def get_supported_device_types(self) -> set:
-        """Get all supported device types."""
-        return ALL_DEVICE_SUPPORTED_TYPES.copy()
+    def get_supported_device_types(self) -> FrozenSet[str]:
+        """Get all supported device types.
+        
+        This is the shared frozenset from const, callers that need to modify it
+        should make their own set() from it.
+        """
+        return ALL_DEVICE_SUPPORTED_TYPES
     
-    def get_device_types_for_platform(self, platform: str) -> set:
+    def get_device_types_for_platform(self, platform: str) -> FrozenSet[str]:
         """Get device types that belong to a specific platform."""
-        return {
-            device_type for device_type, device_platform in DEVICE_TYPE_TO_PLATFORM.items()
-            if device_platform == platform
-        }
+        return _PLATFORM_TO_TYPES.get(platform, frozenset())
     
     def create_device_handler(self, device_type: str, device_config: Dict[str, Any]):
         """Create appropriate device handler following OpenHAB factory pattern."""
-        from .device_handler import (
-            MyHOMELightingHandler,
-            MyHOMEAutomationHandler,
-            MyHOMEThermoregulationHandler,
-            MyHOMEEnergyHandler,
-            MyHOMEScenarioHandler,
-            MyHOMEAlarmHandler,
-            MyHOMEAuxiliaryHandler,
-            MyHOMEGenericHandler,
-        )
-        
-        # Map device types to handlers following OpenHAB pattern
-        if device_type in LIGHTING_SUPPORTED_DEVICE_TYPES | LIGHTING_GROUP_SUPPORTED_DEVICE_TYPES:
-            self.logger.debug("Creating LIGHTING Handler for device type %s", device_type)
-            return MyHOMELightingHandler(self.hass, self.config_entry, device_config)
-        elif device_type in AUTOMATION_SUPPORTED_DEVICE_TYPES:
-            self.logger.debug("Creating AUTOMATION Handler for device type %s", device_type)
-            return MyHOMEAutomationHandler(self.hass, self.config_entry, device_config)
-        elif device_type in THERMOREGULATION_SUPPORTED_DEVICE_TYPES:
-            self.logger.debug("Creating THERMOREGULATION Handler for device type %s", device_type)
-            return MyHOMEThermoregulationHandler(self.hass, self.config_entry, device_config)
-        elif device_type in ENERGY_MANAGEMENT_SUPPORTED_DEVICE_TYPES:
-            self.logger.debug("Creating ENERGY Handler for device type %s", device_type)
-            return MyHOMEEnergyHandler(self.hass, self.config_entry, device_config)
-        elif device_type in SCENARIO_SUPPORTED_DEVICE_TYPES | SCENARIO_BASIC_SUPPORTED_DEVICE_TYPES:
-            self.logger.debug("Creating SCENARIO Handler for device type %s", device_type)
-            return MyHOMEScenarioHandler(self.hass, self.config_entry, device_config)
-        elif device_type in ALARM_SUPPORTED_DEVICE_TYPES:
-            self.logger.debug("Creating ALARM Handler for device type %s", device_type)
-            return MyHOMEAlarmHandler(self.hass, self.config_entry, device_config)
-        elif device_type in AUX_SUPPORTED_DEVICE_TYPES:
-            self.logger.debug("Creating AUXILIARY Handler for device type %s", device_type)
-            return MyHOMEAuxiliaryHandler(self.hass, self.config_entry, device_config)
-        elif device_type in GENERIC_SUPPORTED_DEVICE_TYPES:
-            self.logger.debug("Creating GENERIC Handler for device type %s", device_type)
-            return MyHOMEGenericHandler(self.hass, self.config_entry, device_config)
-        else:
+        device_type = sys.intern(device_type)
+        handler_class = _HANDLER_MAP.get(device_type)
+        if handler_class is None:
             self.logger.warning("Device type %s is not supported by this factory", device_type)
-            return None
\ No newline at end of file
+            return None
+        
+        self.logger.debug("Creating %s for device type %s", handler_class.__name__, device_type)
+        return handler_class(self.hass, self.config_entry, device_config)
@@ -1,7 +1,7 @@
 """Base device handler following OpenHAB patterns."""
 
-from abc import abstractmethod
-from typing import Dict, Any, Optional, Set
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, Mapping, Optional
 import logging
 
 from homeassistant.core import HomeAssistant
@@ -24,27 +24,91 @@ from .const import (
     GENERIC_SUPPORTED_DEVICE_TYPES,
 )
 
+# Handlers serving more than one device type set
+_LIGHTING_HANDLER_DEVICE_TYPES: FrozenSet[str] = (
+    LIGHTING_SUPPORTED_DEVICE_TYPES | LIGHTING_GROUP_SUPPORTED_DEVICE_TYPES
+)
+_SCENARIO_HANDLER_DEVICE_TYPES: FrozenSet[str] = (
+    SCENARIO_SUPPORTED_DEVICE_TYPES | SCENARIO_BASIC_SUPPORTED_DEVICE_TYPES
+)
+
+# Device config keys copied into the device properties
+_CONFIG_PROPERTIES = (
+    ("model", PROPERTY_MODEL),
+    ("firmware_version", PROPERTY_FIRMWARE_VERSION),
+    ("serial_number", PROPERTY_SERIAL_NO),
+)
+
+
+class _DeviceLogAdapter(logging.LoggerAdapter):
+    """Prefix log messages with the device they are about."""
+    
+    def log(self, level, msg, *args, **kwargs):
+        """Log with the prefix as first argument, it is only formatted for emitted records."""
+        if self.isEnabledFor(level):
+            self.logger.log(level, "%s" + msg, self.extra["prefix"], *args, **kwargs)
+
 
 class MyHOMEDeviceHandler:
     """Base class for MyHOME device handlers following OpenHAB patterns."""
     
+    __slots__ = (
+        "hass",
+        "config_entry",
+        "device_config",
+        "_mac",
+        "_device_where",
+        "_device_name",
+        "_device_type",
+        "_unique_id",
+        "_log",
+        "_properties",
+        "_properties_view",
+        "_device_info",
+    )
+    
     # To be overridden by subclasses
-    SUPPORTED_DEVICE_TYPES: Set[str] = set()
+    SUPPORTED_DEVICE_TYPES: FrozenSet[str] = frozenset()
+    CATEGORY_LABEL = "generic"
+    
+    # One logger per handler class, named after it, shared by all its devices
+    logger: logging.Logger = logging.getLogger("MyHOMEDeviceHandler")
+    
+    def __init_subclass__(cls, **kwargs):
+        """Give each handler class its own logger."""
+        super().__init_subclass__(**kwargs)
+        cls.logger = logging.getLogger(cls.__name__)
     
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry, device_config: Dict[str, Any]):
         """Initialize the device handler."""
         self.hass = hass
         self.config_entry = config_entry
         self.device_config = device_config
-        self.logger = logging.getLogger(self.__class__.__name__)
+        self._mac = config_entry.data["mac"]
         
         # Device properties
         self._device_where = device_config.get(CONFIG_PROPERTY_WHERE)
         self._device_name = device_config.get("name", f"MyHOME Device {self._device_where}")
         self._device_type = device_config.get("device_type", "generic_device")
         
+        self._unique_id = f"{self._mac}-{self._device_where}"
+        self._log = _DeviceLogAdapter(
+            self.logger, {"prefix": f"[{self._device_name}@{self._device_where}] "}
+        )
+        
         # Initialize properties following OpenHAB pattern
         self._properties = self._initialize_properties()
+        self._properties_view = MappingProxyType(self._properties)
+        
+        # Device info only depends on values fixed above, build it once
+        self._device_info = {
+            "identifiers": {("myhome", self._unique_id)},
+            "name": self._device_name,
+            "manufacturer": "BTicino/Legrand",
+            "model": self._properties.get(PROPERTY_MODEL, "MyHOME Device"),
+            "sw_version": self._properties.get(PROPERTY_FIRMWARE_VERSION),
+            "via_device": ("myhome", self._mac),
+        }
     
     @property
     def device_where(self) -> Optional[str]:
@@ -64,12 +128,12 @@ class MyHOMEDeviceHandler:
     @property
     def unique_id(self) -> str:
         """Get unique ID for this device."""
-        return f"{self.config_entry.data['mac']}-{self._device_where}"
+        return self._unique_id
     
     @property
-    def properties(self) -> Dict[str, Any]:
-        """Get device properties following OpenHAB pattern."""
-        return self._properties.copy()
+    def properties(self) -> Mapping[str, Any]:
+        """Get read-only device properties following OpenHAB pattern."""
+        return self._properties_view
     
     def _initialize_properties(self) -> Dict[str, Any]:
         """Initialize device properties following OpenHAB pattern."""
@@ -79,14 +143,10 @@ class MyHOMEDeviceHandler:
             properties[PROPERTY_OWNID] = self._device_where
         
         # Add model and other properties from config
-        if "model" in self.device_config:
-            properties[PROPERTY_MODEL] = self.device_config["model"]
-        
-        if "firmware_version" in self.device_config:
-            properties[PROPERTY_FIRMWARE_VERSION] = self.device_config["firmware_version"]
-        
-        if "serial_number" in self.device_config:
-            properties[PROPERTY_SERIAL_NO] = self.device_config["serial_number"]
+        device_config = self.device_config
+        for config_key, property_key in _CONFIG_PROPERTIES:
+            if config_key in device_config:
+                properties[property_key] = device_config[config_key]
         
         return properties
     
@@ -95,196 +155,109 @@ class MyHOMEDeviceHandler:
         """Check if this handler supports the given device type."""
         return device_type in cls.SUPPORTED_DEVICE_TYPES
     
-    @abstractmethod
     async def async_initialize(self) -> bool:
         """Initialize the device handler. Returns True if successful."""
-        pass
+        self.log_debug("Initializing %s device", self.CATEGORY_LABEL)
+        return True
     
-    @abstractmethod
     async def async_update_state(self) -> None:
         """Update device state."""
-        pass
+        self.log_debug("Updating %s device state", self.CATEGORY_LABEL)
     
-    @abstractmethod
     def handle_message(self, message: Any) -> None:
         """Handle incoming messages for this device."""
-        pass
+        self.log_debug("Handling %s message: %s", self.CATEGORY_LABEL, message)
     
     def get_device_info(self) -> Dict[str, Any]:
         """Get device info dictionary for Home Assistant."""
-        return {
-            "identifiers": {("myhome", self.unique_id)},
-            "name": self.device_name,
-            "manufacturer": "BTicino/Legrand",
-            "model": self.properties.get(PROPERTY_MODEL, "MyHOME Device"),
-            "sw_version": self.properties.get(PROPERTY_FIRMWARE_VERSION),
-            "via_device": ("myhome", self.config_entry.data["mac"]),
-        }
+        # Callers may modify the dictionary, only hand out copies of the cached one
+        device_info = self._device_info
+        return {**device_info, "identifiers": set(device_info["identifiers"])}
     
     def log_debug(self, message: str, *args) -> None:
         """Log debug message with device context."""
-        self.logger.debug(f"[{self.device_name}@{self._device_where}] {message}", *args)
+        self._log.debug(message, *args)
     
     def log_info(self, message: str, *args) -> None:
         """Log info message with device context."""
-        self.logger.info(f"[{self.device_name}@{self._device_where}] {message}", *args)
+        self._log.info(message, *args)
     
     def log_warning(self, message: str, *args) -> None:
         """Log warning message with device context."""
-        self.logger.warning(f"[{self.device_name}@{self._device_where}] {message}", *args)
+        self._log.warning(message, *args)
     
     def log_error(self, message: str, *args) -> None:
         """Log error message with device context."""
-        self.logger.error(f"[{self.device_name}@{self._device_where}] {message}", *args)
+        self._log.error(message, *args)
 
 
 class MyHOMELightingHandler(MyHOMEDeviceHandler):
     """Handler for lighting devices following OpenHAB patterns."""
     
-    SUPPORTED_DEVICE_TYPES = LIGHTING_SUPPORTED_DEVICE_TYPES | LIGHTING_GROUP_SUPPORTED_DEVICE_TYPES
+    __slots__ = ()
     
-    async def async_initialize(self) -> bool:
-        """Initialize lighting device."""
-        self.log_debug("Initializing lighting device")
-        return True
-    
-    async def async_update_state(self) -> None:
-        """Update lighting device state."""
-        self.log_debug("Updating lighting device state")
-    
-    def handle_message(self, message: Any) -> None:
-        """Handle lighting message."""
-        self.log_debug("Handling lighting message: %s", message)
+    SUPPORTED_DEVICE_TYPES = _LIGHTING_HANDLER_DEVICE_TYPES
+    CATEGORY_LABEL = "lighting"
 
 
 class MyHOMEAutomationHandler(MyHOMEDeviceHandler):
     """Handler for automation devices following OpenHAB patterns."""
     
-    SUPPORTED_DEVICE_TYPES = AUTOMATION_SUPPORTED_DEVICE_TYPES
-    
-    async def async_initialize(self) -> bool:
-        """Initialize automation device."""
-        self.log_debug("Initializing automation device")
-        return True
-    
-    async def async_update_state(self) -> None:
-        """Update automation device state."""
-        self.log_debug("Updating automation device state")
+    __slots__ = ()
     
-    def handle_message(self, message: Any) -> None:
-        """Handle automation message."""
-        self.log_debug("Handling automation message: %s", message)
+    SUPPORTED_DEVICE_TYPES = AUTOMATION_SUPPORTED_DEVICE_TYPES
+    CATEGORY_LABEL = "automation"
 
 
 class MyHOMEThermoregulationHandler(MyHOMEDeviceHandler):
     """Handler for thermoregulation devices following OpenHAB patterns."""
     
-    SUPPORTED_DEVICE_TYPES = THERMOREGULATION_SUPPORTED_DEVICE_TYPES
-    
-    async def async_initialize(self) -> bool:
-        """Initialize thermoregulation device."""
-        self.log_debug("Initializing thermoregulation device")
-        return True
-    
-    async def async_update_state(self) -> None:
-        """Update thermoregulation device state."""
-        self.log_debug("Updating thermoregulation device state")
+    __slots__ = ()
     
-    def handle_message(self, message: Any) -> None:
-        """Handle thermoregulation message."""
-        self.log_debug("Handling thermoregulation message: %s", message)
+    SUPPORTED_DEVICE_TYPES = THERMOREGULATION_SUPPORTED_DEVICE_TYPES
+    CATEGORY_LABEL = "thermoregulation"
 
 
 class MyHOMEEnergyHandler(MyHOMEDeviceHandler):
     """Handler for energy management devices following OpenHAB patterns."""
     
-    SUPPORTED_DEVICE_TYPES = ENERGY_MANAGEMENT_SUPPORTED_DEVICE_TYPES
-    
-    async def async_initialize(self) -> bool:
-        """Initialize energy device."""
-        self.log_debug("Initializing energy device")
-        return True
-    
-    async def async_update_state(self) -> None:
-        """Update energy device state."""
-        self.log_debug("Updating energy device state")
+    __slots__ = ()
     
-    def handle_message(self, message: Any) -> None:
-        """Handle energy message."""
-        self.log_debug("Handling energy message: %s", message)
+    SUPPORTED_DEVICE_TYPES = ENERGY_MANAGEMENT_SUPPORTED_DEVICE_TYPES
+    CATEGORY_LABEL = "energy"
 
 
 class MyHOMEScenarioHandler(MyHOMEDeviceHandler):
     """Handler for scenario devices following OpenHAB patterns."""
     
-    SUPPORTED_DEVICE_TYPES = SCENARIO_SUPPORTED_DEVICE_TYPES | SCENARIO_BASIC_SUPPORTED_DEVICE_TYPES
+    __slots__ = ()
     
-    async def async_initialize(self) -> bool:
-        """Initialize scenario device."""
-        self.log_debug("Initializing scenario device")
-        return True
-    
-    async def async_update_state(self) -> None:
-        """Update scenario device state."""
-        self.log_debug("Updating scenario device state")
-    
-    def handle_message(self, message: Any) -> None:
-        """Handle scenario message."""
-        self.log_debug("Handling scenario message: %s", message)
+    SUPPORTED_DEVICE_TYPES = _SCENARIO_HANDLER_DEVICE_TYPES
+    CATEGORY_LABEL = "scenario"
 
 
 class MyHOMEAlarmHandler(MyHOMEDeviceHandler):
     """Handler for alarm devices following OpenHAB patterns."""
     
-    SUPPORTED_DEVICE_TYPES = ALARM_SUPPORTED_DEVICE_TYPES
-    
-    async def async_initialize(self) -> bool:
-        """Initialize alarm device."""
-        self.log_debug("Initializing alarm device")
-        return True
-    
-    async def async_update_state(self) -> None:
-        """Update alarm device state."""
-        self.log_debug("Updating alarm device state")
+    __slots__ = ()
     
-    def handle_message(self, message: Any) -> None:
-        """Handle alarm message."""
-        self.log_debug("Handling alarm message: %s", message)
+    SUPPORTED_DEVICE_TYPES = ALARM_SUPPORTED_DEVICE_TYPES
+    CATEGORY_LABEL = "alarm"
 
 
 class MyHOMEAuxiliaryHandler(MyHOMEDeviceHandler):
     """Handler for auxiliary devices following OpenHAB patterns."""
     
-    SUPPORTED_DEVICE_TYPES = AUX_SUPPORTED_DEVICE_TYPES
-    
-    async def async_initialize(self) -> bool:
-        """Initialize auxiliary device."""
-        self.log_debug("Initializing auxiliary device")
-        return True
-    
-    async def async_update_state(self) -> None:
-        """Update auxiliary device state."""
-        self.log_debug("Updating auxiliary device state")
+    __slots__ = ()
     
-    def handle_message(self, message: Any) -> None:
-        """Handle auxiliary message."""
-        self.log_debug("Handling auxiliary message: %s", message)
+    SUPPORTED_DEVICE_TYPES = AUX_SUPPORTED_DEVICE_TYPES
+    CATEGORY_LABEL = "auxiliary"
 
 
 class MyHOMEGenericHandler(MyHOMEDeviceHandler):
     """Handler for generic/unknown devices following OpenHAB patterns."""
     
-    SUPPORTED_DEVICE_TYPES = GENERIC_SUPPORTED_DEVICE_TYPES
-    
-    async def async_initialize(self) -> bool:
-        """Initialize generic device."""
-        self.log_debug("Initializing generic device")
-        return True
-    
-    async def async_update_state(self) -> None:
-        """Update generic device state."""
-        self.log_debug("Updating generic device state")
+    __slots__ = ()
     
-    def handle_message(self, message: Any) -> None:
-        """Handle generic message."""
-        self.log_debug("Handling generic message: %s", message)
\ No newline at end of file
+    SUPPORTED_DEVICE_TYPES = GENERIC_SUPPORTED_DEVICE_TYPES
+    CATEGORY_LABEL = "generic"
@@ -1,16 +1,20 @@
 """Device discovery service for MyHOME integration following OpenHAB patterns."""
 
 import asyncio
+from functools import cache, lru_cache
 import logging
-from typing import Dict, Any, Optional, Set
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Set, Tuple
 from datetime import datetime
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from OWNd.message import (
     OWNMessage,
+    OWNCommand,
     OWNLightingEvent,
     OWNLightingCommand,
     OWNAutomationEvent,
@@ -27,6 +31,8 @@ from OWNd.message import (
 
 from .const import (
     DOMAIN,
+    SIGNAL_DEVICES_DISCOVERED,
+    SIGNAL_DISCOVERY_COMPLETED,
     DEVICE_TYPE_BUS_ON_OFF_SWITCH,
     DEVICE_TYPE_BUS_DIMMER,
     DEVICE_TYPE_BUS_AUTOMATION,
@@ -40,10 +46,172 @@ from .const import (
     DEVICE_TYPE_BUS_ALARM_ZONE,
     DEVICE_TYPE_GENERIC,
     DEVICE_TYPE_TO_PLATFORM,
+    DEVICE_TYPE_MODEL_LABEL,
     ALL_DEVICE_SUPPORTED_TYPES,
 )
 from .device_factory import MyHOMEDeviceFactory
 
+# Seconds during which discovered devices are collected before handing them over
+DISCOVERY_RESULT_BATCH_DELAY = 0.5
+
+# Seconds to wait for a device to answer a targeted discovery
+DEVICE_DISCOVERY_TIMEOUT = 2
+
+# Status requests for common device types
+DISCOVERY_COMMANDS = (
+    "*#1*0##",   # Request all lighting device status (WHO=1)
+    "*#2*0##",   # Request all automation device status (WHO=2)
+    "*#4*0##",   # Request all thermoregulation device status (WHO=4)
+    "*#18*0##",  # Request all energy management device status (WHO=18) - May not be supported by all gateways
+    "*#25*0##",  # Request all CEN/dry contact device status (WHO=25)
+    "*#9*0##",   # Request all auxiliary device status (WHO=9) - May not be supported by all gateways
+)
+
+# Subsystems whose discovery command may fail on some gateways, by WHO
+_OPTIONAL_SUBSYSTEM_NAMES = {
+    "18": "Energy Management (WHO=18)",
+    "9": "Auxiliary (WHO=9)",
+    "25": "CEN/Dry Contact (WHO=25)",
+}
+
+# WHO types tried when discovering a single address, with their status request format
+# lighting, automation, thermo, energy, CEN, aux
+TARGETED_DISCOVERY_WHO_TYPES = (1, 2, 4, 18, 25, 9)
+_TARGETED_DISCOVERY_FORMATS = tuple(
+    (who, f"*#{who}*{{}}##") for who in TARGETED_DISCOVERY_WHO_TYPES
+)
+
+# Device type of devices answering a status request, by WHO. Used for the
+# messages OWNd parses into a class without its own detection, such as the
+# energy (WHO 18), auxiliary (WHO 9) and dry contact (WHO 25) commands.
+# For lighting (WHO=1), be conservative about dimmer detection
+# WHAT values for lighting:
+# 0 = OFF
+# 1 = ON
+# 2-10 = Potentially dimming levels (20%-100%)
+# 8 = Often indicates "temporized ON" or special state, not a dimming level
+# Note: Just because a device responds with a dimming WHAT value doesn't mean it's actually a dimmer
+# Some on/off switches may respond with these values. Default to on/off switch to be safe.
+_RESPONSE_WHO_TO_DEVICE_TYPE = {
+    "1": DEVICE_TYPE_BUS_ON_OFF_SWITCH,
+    "2": DEVICE_TYPE_BUS_AUTOMATION,
+    "4": DEVICE_TYPE_BUS_THERMO_ZONE,
+    "18": DEVICE_TYPE_BUS_ENERGY_METER,
+    "9": DEVICE_TYPE_BUS_AUX,
+    "25": DEVICE_TYPE_BUS_CEN_SCENARIO_CONTROL,
+}
+
+# Message attributes that may hold the device WHERE address, in order of preference
+_WHERE_ATTRS = ('where', 'entity', 'object', 'address')
+
+# Errors OWNd message properties raise on frames they cannot decode
+_MESSAGE_ERRORS = (AttributeError, IndexError, KeyError, TypeError, ValueError)
+
+# Properties every device discovered from a message class starts with
+_MESSAGE_CLASS_PROPERTIES = {
+    OWNAutomationEvent: {"shutter_type": "standard"},
+    OWNEnergyEvent: {"meter_type": "energy"},
+}
+
+
+def _determine_lighting_device_type(message, properties: Dict[str, Any]) -> str:
+    """Determine lighting device type following OpenHAB patterns."""
+    # Be conservative about dimmer detection - require explicit brightness information
+    # Check if it's a dimmer based on actual brightness capabilities
+    brightness = getattr(message, 'brightness', None)
+    if brightness is not None and brightness > 0:
+        # Only consider it a dimmer if it has actual brightness level (not just 0/1)
+        properties["brightness"] = brightness
+        properties["dimmable"] = True
+        properties["detection_confidence"] = "high"
+        return DEVICE_TYPE_BUS_DIMMER
+    elif getattr(message, 'brightness_preset', None):
+        # Has brightness preset capability
+        properties["dimmable"] = True
+        properties["detection_confidence"] = "medium"
+        return DEVICE_TYPE_BUS_DIMMER
+    else:
+        # Default to on/off switch - user can manually configure as dimmer if needed
+        properties["dimmable"] = False
+        properties["detection_confidence"] = "high"
+        properties["note"] = "Detected as on/off switch. If this device supports dimming, manually configure dimmable: true"
+        return DEVICE_TYPE_BUS_ON_OFF_SWITCH
+
+
+def _determine_thermo_device_type(message, properties: Dict[str, Any]) -> str:
+    """Determine thermoregulation device type following OpenHAB patterns."""
+    # Check message properties to determine if it's a zone or sensor
+    temperature = getattr(message, 'temperature', None)
+    if temperature is not None:
+        properties["temperature"] = temperature
+        device_type = DEVICE_TYPE_BUS_THERMO_SENSOR
+    else:
+        device_type = DEVICE_TYPE_BUS_THERMO_ZONE
+    properties["thermo_type"] = device_type
+    return device_type
+
+
+# Map message types to device types following OpenHAB patterns
+# Keyed by message class, looked up with type(message). Detection
+# adds the properties it found out about the device on the way.
+_MESSAGE_TO_DEVICE_TYPE = {
+    OWNLightingEvent: _determine_lighting_device_type,
+    OWNLightingCommand: _determine_lighting_device_type,
+    OWNAutomationEvent: lambda msg, properties: DEVICE_TYPE_BUS_AUTOMATION,
+    OWNAutomationCommand: lambda msg, properties: DEVICE_TYPE_BUS_AUTOMATION,
+    OWNEnergyEvent: lambda msg, properties: DEVICE_TYPE_BUS_ENERGY_METER,
+    OWNHeatingEvent: _determine_thermo_device_type,
+    OWNHeatingCommand: _determine_thermo_device_type,
+    OWNDryContactEvent: lambda msg, properties: DEVICE_TYPE_BUS_DRY_CONTACT_IR,
+    OWNAuxEvent: lambda msg, properties: DEVICE_TYPE_BUS_AUX,
+    OWNCENEvent: lambda msg, properties: DEVICE_TYPE_BUS_CEN_SCENARIO_CONTROL,
+    OWNCENPlusEvent: lambda msg, properties: DEVICE_TYPE_BUS_CENPLUS_SCENARIO_CONTROL,
+    OWNAlarmEvent: lambda msg, properties: DEVICE_TYPE_BUS_ALARM_ZONE,
+}
+
+
+def _add_automation_properties(properties: Dict[str, Any], message: OWNMessage) -> None:
+    """Add automation properties following OpenHAB patterns."""
+    if hasattr(message, 'run_time'):
+        properties["run_time"] = message.run_time
+
+
+def _add_energy_properties(properties: Dict[str, Any], message: OWNMessage) -> None:
+    """Add energy management properties following OpenHAB patterns."""
+    if hasattr(message, 'power'):
+        properties["power"] = message.power
+
+
+# Device-specific properties added per message class
+_MESSAGE_TO_PROPERTIES = {
+    OWNAutomationEvent: _add_automation_properties,
+    OWNEnergyEvent: _add_energy_properties,
+}
+
+# Initial device properties per message class, copied for each new device
+_MESSAGE_TO_BASE_PROPERTIES = {
+    message_class: {
+        "message_type": message_class.__name__,
+        **_MESSAGE_CLASS_PROPERTIES.get(message_class, {}),
+    }
+    for message_class in _MESSAGE_TO_DEVICE_TYPE
+}
+
+
+@lru_cache(maxsize=256)
+def _parse_command(command: str) -> Optional[OWNCommand]:
+    """Parse a discovery command, the same commands are sent on every discovery."""
+    own_command = OWNCommand.parse(command)
+    if own_command and own_command.is_valid:
+        return own_command
+    return None
+
+
+@cache
+def _parsed_discovery_commands() -> Tuple[Tuple[str, Optional[OWNCommand]], ...]:
+    """Get the discovery commands with their parsed form, None if they do not parse."""
+    return tuple((command, _parse_command(command)) for command in DISCOVERY_COMMANDS)
+
 
 class MyHOMEDeviceDiscoveryService:
     """Discovery service for MyHOME devices following OpenHAB patterns."""
@@ -55,32 +223,48 @@ class MyHOMEDeviceDiscoveryService:
         self.gateway_handler = gateway_handler
         self.device_factory = MyHOMEDeviceFactory(hass, config_entry)
         self.logger = logging.getLogger(__name__)
+        # Per message debug logs are skipped outright unless enabled, checked per discovery
+        self._debug = self.logger.isEnabledFor(logging.DEBUG)
+        self._mac = config_entry.data["mac"]
+        self._entry_id = config_entry.entry_id
+        self._unique_id_prefix = f"{self._mac}-"
         
         # Discovery state
+        # Keyed by WHERE address, the gateway is the same for all of them
         self._discovered_devices: Dict[str, Dict[str, Any]] = {}
+        self._discovered_devices_view = MappingProxyType(self._discovered_devices)
+        # WHERE addresses not to report again: the discovered ones and, unless
+        # rediscovering, the ones already registered before this discovery
+        self._seen_wheres: Set[str] = set()
         self._discovery_active = False
         self._discovery_timeout = 60  # seconds
         self._discovery_task: Optional[asyncio.Task] = None
-        
-        # Device type mapping from messages
-        self._message_to_device_type = {
-            # Map message types to device types following OpenHAB patterns
-            "OWNLightingEvent": self._determine_lighting_device_type,
-            "OWNLightingCommand": self._determine_lighting_device_type,
-            "OWNAutomationEvent": lambda msg: DEVICE_TYPE_BUS_AUTOMATION,
-            "OWNAutomationCommand": lambda msg: DEVICE_TYPE_BUS_AUTOMATION,
-            "OWNEnergyEvent": lambda msg: DEVICE_TYPE_BUS_ENERGY_METER,
-            "OWNHeatingEvent": self._determine_thermo_device_type,
-            "OWNHeatingCommand": self._determine_thermo_device_type,
-            "OWNDryContactEvent": lambda msg: DEVICE_TYPE_BUS_DRY_CONTACT_IR,
-            "OWNAuxEvent": lambda msg: DEVICE_TYPE_BUS_AUX,
-            "OWNCENEvent": lambda msg: DEVICE_TYPE_BUS_CEN_SCENARIO_CONTROL,
-            "OWNCENPlusEvent": lambda msg: DEVICE_TYPE_BUS_CENPLUS_SCENARIO_CONTROL,
-            "OWNAlarmEvent": lambda msg: DEVICE_TYPE_BUS_ALARM_ZONE,
+        self._discovery_done = asyncio.Event()
+        
+        # Discovery results not yet handed over to the discovery config flow
+        self._pending_results: List[Dict[str, Any]] = []
+        self._pending_results_handle: Optional[asyncio.TimerHandle] = None
+        self._pending_results_stamp = ""
+        
+        # Targeted discoveries waiting for their device, by WHERE address
+        self._device_waiters: Dict[str, asyncio.Future] = {}
+        
+        # Platform, category and name prefix only depend on the device type
+        self._device_type_meta: Dict[str, Tuple[str, str, str]] = {
+            device_type: (
+                DEVICE_TYPE_TO_PLATFORM.get(device_type, "sensor"),
+                self.device_factory.get_device_category(device_type),
+                f"{DEVICE_TYPE_MODEL_LABEL[device_type]} ",
+            )
+            for device_type in ALL_DEVICE_SUPPORTED_TYPES
         }
     
-    async def start_discovery(self) -> None:
-        """Start device discovery process following OpenHAB patterns."""
+    async def start_discovery(self, rediscover: bool = False) -> None:
+        """Start device discovery process following OpenHAB patterns.
+        
+        Devices of this gateway already in the device registry are not reported
+        again, unless rediscover is set.
+        """
         if self._discovery_active:
             self.logger.warning("Discovery already active")
             return
@@ -89,304 +273,283 @@ class MyHOMEDeviceDiscoveryService:
                         self.gateway_handler.name)
         
         self._discovery_active = True
+        self._debug = self.logger.isEnabledFor(logging.DEBUG)
+        self._discovery_done.clear()
         self._discovered_devices.clear()
+        self._seen_wheres = set() if rediscover else self._registered_wheres()
         
         # Log discovery status
         self.logger.info("Discovery activated: %s", self._discovery_active)
         self.logger.info("Discovery timeout: %s seconds", self._discovery_timeout)
         
-        # Start discovery task with timeout
+        # Start discovery task, it completes the discovery on timeout
         self._discovery_task = asyncio.create_task(self._discovery_worker())
-        
-        # Schedule discovery completion
-        self.hass.loop.call_later(self._discovery_timeout, self._complete_discovery)
     
     async def stop_discovery(self) -> None:
         """Stop device discovery process."""
-        if not self._discovery_active:
+        if not self._async_stop_discovery():
             return
         
-        self.logger.info("Stopping MyHOME device discovery")
-        self._discovery_active = False
-        
-        if self._discovery_task and not self._discovery_task.done():
-            self._discovery_task.cancel()
+        if self._discovery_task:
             try:
                 await self._discovery_task
             except asyncio.CancelledError:
                 pass
     
+    @callback
+    def _async_stop_discovery(self) -> bool:
+        """Stop discovery and cancel its worker, return False if it was not active."""
+        if not self._discovery_active:
+            return False
+        
+        self.logger.info("Stopping MyHOME device discovery")
+        self._discovery_active = False
+        self._discovery_done.set()
+        self._send_discovery_results()
+        
+        # The worker itself stops the discovery when it times out, it is done then
+        task = self._discovery_task
+        if task and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+        return True
+    
+    def _registered_wheres(self) -> Set[str]:
+        """Get the WHERE addresses of this gateway's devices in the device registry."""
+        prefix = self._unique_id_prefix
+        return {
+            identifier[len(prefix):]
+            for device in dr.async_entries_for_config_entry(
+                dr.async_get(self.hass), self._entry_id
+            )
+            for domain, identifier in device.identifiers
+            if domain == DOMAIN and identifier.startswith(prefix)
+        }
+    
     def handle_discovery_message(self, message: OWNMessage) -> None:
         """Handle incoming messages for device discovery following OpenHAB patterns."""
-        self.logger.debug("Discovery message received: %s (type: %s, discovery_active: %s)", 
-                         message, type(message).__name__, self._discovery_active)
-        
+        # Called for every message from the gateway, discovery or not
         if not self._discovery_active:
-            self.logger.debug("Discovery not active, ignoring message")
+            return
+        
+        message_class = type(message)
+        if self._debug:
+            self.logger.debug("Discovery message received: %s (type: %s)", 
+                             message, message_class.__name__)
+        
+        # Handle both event messages and status response messages, the other
+        # message classes only tell the device type by their WHO
+        if message_class not in _MESSAGE_TO_DEVICE_TYPE:
+            self._handle_response_message(message)
             return
         
         try:
-            # Handle both event messages and status response messages
-            device_info = self._extract_device_info(message)
-            self.logger.debug("Extracted device info: %s", device_info)
-            if device_info:
-                device_id = device_info["unique_id"]
-                if device_id not in self._discovered_devices:
-                    self.logger.info("Discovered new device: %s (%s) at WHERE=%s", 
-                                    device_info["name"], device_info["device_type"], device_info["where"])
-                    self._discovered_devices[device_id] = device_info
-                    
-                    # Immediately create discovery result following OpenHAB pattern
-                    self._create_discovery_result(device_info)
-                else:
-                    self.logger.debug("Device %s already discovered, skipping", device_id)
-            else:
-                # If we can't extract device info, log the message for debugging
+            where = self._extract_where(message)
+        except _MESSAGE_ERRORS as e:
+            self.logger.error("Error handling discovery message %s: %s", message, e)
+            return
+        
+        if not where:
+            if self._debug:
                 self.logger.debug("Could not extract device info from message: %s", message)
-                # Try to handle as raw response string for discovery commands
-                if hasattr(message, '__str__'):
-                    message_str = str(message)
-                    if message_str.startswith('*') and message_str.endswith('##'):
-                        self.logger.debug("Processing message as potential command response: %s", message_str)
-                        self.handle_command_response(message_str)
+            return
         
-        except Exception as e:
+        # Most messages come from devices already seen, skip them first
+        if where in self._seen_wheres:
+            if self._debug:
+                self.logger.debug("Device at WHERE=%s already discovered, skipping", where)
+            return
+        
+        try:
+            device_info = self._build_device_info(where, message_class, message)
+        except _MESSAGE_ERRORS as e:
             self.logger.error("Error handling discovery message %s: %s", message, e)
+            return
+        
+        if self._debug:
+            self.logger.debug("Extracted device info: %s", device_info)
+        
+        # Immediately create discovery result following OpenHAB pattern
+        self._create_discovery_result(device_info)
     
-    def handle_command_response(self, response_string: str) -> None:
-        """Handle command response strings for discovery."""
-        if not self._discovery_active:
+    def _handle_response_message(self, message: OWNMessage) -> None:
+        """Handle a discovery message of a class without its own device type detection."""
+        who = str(getattr(message, "who", ""))
+        if who not in _RESPONSE_WHO_TO_DEVICE_TYPE:
+            if self._debug:
+                self.logger.debug("Message type %s not in supported types", 
+                                type(message).__name__)
             return
-            
+        
         try:
-            self.logger.debug("Processing command response for discovery: %s", response_string)
-            
-            # Parse the response string manually
-            # Format: *WHO*WHAT*WHERE##
-            if response_string.startswith('*') and response_string.endswith('##'):
-                parts = response_string[1:-2].split('*')
-                if len(parts) >= 3:
-                    who, what, where = parts[0], parts[1], parts[2]
-                    
-                    # Create a synthetic device info based on the response
-                    device_info = self._create_device_info_from_response(who, what, where)
-                    if device_info:
-                        device_id = device_info["unique_id"]
-                        if device_id not in self._discovered_devices:
-                            self.logger.debug("Discovered device from command response: %s", device_info["name"])
-                            self._discovered_devices[device_id] = device_info
-                            self._create_discovery_result(device_info)
-                            
-        except Exception as e:
-            self.logger.error("Error processing command response %s: %s", response_string, e)
+            where = self._extract_where(message)
+            what = message.event_content.get("what")
+        except _MESSAGE_ERRORS as e:
+            self.logger.error("Error handling discovery message %s: %s", message, e)
+            return
+        
+        if not where or where in self._seen_wheres:
+            return
+        
+        # Create a synthetic device info based on the response
+        device_info = self._create_device_info_from_response(
+            who, None if what is None else str(what), where
+        )
+        if device_info:
+            self.logger.debug("Discovered device from command response: %s", device_info["name"])
+            self._create_discovery_result(device_info)
     
-    def _create_device_info_from_response(self, who: str, what: str, where: str) -> Optional[Dict[str, Any]]:
+    def _create_device_info_from_response(
+        self, who: str, what: Optional[str], where: str
+    ) -> Optional[Dict[str, Any]]:
         """Create device info from command response parts."""
-        try:
-            # Map WHO to device type and platform
-            # For lighting (WHO=1), be conservative about dimmer detection
-            # WHAT values for lighting:
-            # 0 = OFF
-            # 1 = ON
-            # 2-10 = Potentially dimming levels (20%-100%)
-            # 8 = Often indicates "temporized ON" or special state, not a dimming level
-            # Note: Just because a device responds with a dimming WHAT value doesn't mean it's actually a dimmer
-            # Some on/off switches may respond with these values. Default to on/off switch to be safe.
-            is_dimmer = False  # Default to on/off switch for safer device identification
-            
-            who_to_device_type = {
-                "1": ("bus_dimmer" if is_dimmer else "bus_on_off_switch", "light"),
-                "2": ("bus_automation", "cover"),
-                "4": ("bus_thermo_zone", "climate"),
-                "18": ("bus_energy_meter", "sensor"),
-                "9": ("bus_aux", "switch"),
-                "25": ("bus_cen_scenario_control", "button"),
-            }
-            
-            self.logger.debug("Device type detection for WHO=%s WHAT=%s WHERE=%s: is_dimmer=%s", 
-                            who, what, where, is_dimmer)
-            
-            if who not in who_to_device_type:
-                return None
-                
-            device_type, platform = who_to_device_type[who]
-            
-            # Create device info
-            device_info = {
-                "unique_id": f"{self.config_entry.data['mac']}-{where}",
-                "name": f"MyHOME {device_type.replace('_', ' ').title()} {where}",
-                "device_type": device_type,
-                "where": where,
-                "platform": platform,
-                "category": self.device_factory.get_device_category(device_type),
-                "properties": {
-                    "ownId": f"{who}*{where}",
-                    "where": where,
-                    "discovered_at": datetime.now().isoformat(),
-                    "response_who": who,
-                    "response_what": what,
-                }
-            }
-            
-            return device_info
-            
-        except Exception as e:
-            self.logger.error("Error creating device info from response WHO=%s WHAT=%s WHERE=%s: %s", who, what, where, e)
-            return None
-    
-    def _extract_device_info(self, message: OWNMessage) -> Optional[Dict[str, Any]]:
-        """Extract device information from message following OpenHAB patterns."""
-        message_type = type(message).__name__
-        self.logger.debug("Extracting device info from message type: %s", message_type)
-        
-        if message_type not in self._message_to_device_type:
-            self.logger.debug("Message type %s not in supported types: %s", 
-                            message_type, list(self._message_to_device_type.keys()))
+        self.logger.debug("Device type detection for WHO=%s WHAT=%s WHERE=%s", 
+                        who, what, where)
+        
+        device_type = _RESPONSE_WHO_TO_DEVICE_TYPE.get(who)
+        if device_type is None:
             return None
         
+        return self._new_device_info(where, device_type, {
+            "ownId": f"{who}*{where}",
+            "where": where,
+            "response_who": who,
+            "response_what": what,
+        })
+    
+    def _extract_where(self, message: OWNMessage) -> Optional[str]:
+        """Extract the device WHERE address from a discovery message."""
         # Get device WHERE address - try multiple attributes
-        where = None
-        for attr in ['where', 'entity', 'object', 'address']:
-            if hasattr(message, attr):
-                where = getattr(message, attr, None)
-                if where:
-                    break
-        
-        self.logger.debug("Found WHERE address: %s from message: %s", where, message)
+        where = next(
+            (value for attr in _WHERE_ATTRS if (value := getattr(message, attr, None))),
+            None,
+        )
+        
+        if self._debug:
+            self.logger.debug("Found WHERE address: %s from message: %s", where, message)
         if not where:
             self.logger.debug("No WHERE address found in message")
             return None
         
         # Convert WHERE to string and clean it up
-        where = str(where)
+        if type(where) is not str:
+            where = str(where)
         if where.startswith('#'):
             # Skip group addresses during discovery for now
             self.logger.debug("Skipping group address: %s", where)
             return None
         
+        return where
+    
+    def _build_device_info(
+        self, where: str, message_class: type, message: OWNMessage
+    ) -> Dict[str, Any]:
+        """Build the information of a newly discovered device following OpenHAB patterns."""
+        properties = _MESSAGE_TO_BASE_PROPERTIES[message_class].copy()
+        properties["ownId"] = f"{message.who}*{where}" if hasattr(message, 'who') else where
+        properties["where"] = where
+        if self._debug:
+            # Only kept to debug detection, nothing reads it
+            properties["message_str"] = str(message)
+        
         # Determine device type using OpenHAB-style mapping
-        device_type_func = self._message_to_device_type[message_type]
-        device_type = device_type_func(message)
+        device_type = _MESSAGE_TO_DEVICE_TYPE[message_class](message, properties)
         
-        if not device_type or device_type not in ALL_DEVICE_SUPPORTED_TYPES:
+        # Add device-specific properties
+        add_properties = _MESSAGE_TO_PROPERTIES.get(message_class)
+        if add_properties is not None:
+            add_properties(properties, message)
+        
+        return self._new_device_info(where, device_type, properties)
+    
+    def _new_device_info(
+        self, where: str, device_type: Optional[str], properties: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Create the device info of a newly discovered device following OpenHAB patterns."""
+        # The metadata table holds exactly the supported device types
+        meta = self._device_type_meta.get(device_type)
+        if meta is None:
             device_type = DEVICE_TYPE_GENERIC
+            meta = self._device_type_meta[device_type]
+        platform, category, name_prefix = meta
         
-        # Create device info following OpenHAB patterns
-        device_info = {
-            "unique_id": f"{self.config_entry.data['mac']}-{where}",
-            "name": f"MyHOME {device_type.replace('_', ' ').title()} {where}",
+        return {
+            "unique_id": self._unique_id_prefix + where,
+            "name": name_prefix + where,
             "device_type": device_type,
             "where": where,
-            "platform": DEVICE_TYPE_TO_PLATFORM.get(device_type, "sensor"),
-            "category": self.device_factory.get_device_category(device_type),
-            "properties": {
-                "ownId": f"{message.who}*{where}" if hasattr(message, 'who') else where,
-                "where": where,
-                "discovered_at": datetime.now().isoformat(),
-                "message_type": message_type,
-                "message_str": str(message),
-            }
+            "platform": platform,
+            "category": category,
+            "properties": properties,
         }
-        
-        # Add device-specific properties
-        self._add_device_specific_properties(device_info, message)
-        
-        return device_info
-    
-    def _determine_lighting_device_type(self, message) -> str:
-        """Determine lighting device type following OpenHAB patterns."""
-        # Be conservative about dimmer detection - require explicit brightness information
-        # Check if it's a dimmer based on actual brightness capabilities
-        if hasattr(message, 'brightness') and message.brightness is not None and message.brightness > 0:
-            # Only consider it a dimmer if it has actual brightness level (not just 0/1)
-            return DEVICE_TYPE_BUS_DIMMER
-        elif hasattr(message, 'brightness_preset') and message.brightness_preset:
-            # Has brightness preset capability
-            return DEVICE_TYPE_BUS_DIMMER
-        else:
-            # Default to on/off switch - user can manually configure as dimmer if needed
-            return DEVICE_TYPE_BUS_ON_OFF_SWITCH
-    
-    def _determine_thermo_device_type(self, message) -> str:
-        """Determine thermoregulation device type following OpenHAB patterns."""
-        # Check message properties to determine if it's a zone or sensor
-        if hasattr(message, 'temperature') and message.temperature is not None:
-            return DEVICE_TYPE_BUS_THERMO_SENSOR
-        else:
-            return DEVICE_TYPE_BUS_THERMO_ZONE
-    
-    def _add_device_specific_properties(self, device_info: Dict[str, Any], message: OWNMessage) -> None:
-        """Add device-specific properties following OpenHAB patterns."""
-        properties = device_info["properties"]
-        
-        # Add message-specific properties
-        if isinstance(message, OWNLightingEvent):
-            if hasattr(message, 'brightness') and message.brightness is not None and message.brightness > 0:
-                properties["brightness"] = message.brightness
-                properties["dimmable"] = True
-                properties["detection_confidence"] = "high"
-            elif hasattr(message, 'brightness_preset') and message.brightness_preset:
-                properties["dimmable"] = True
-                properties["detection_confidence"] = "medium"
-            else:
-                properties["dimmable"] = False
-                properties["detection_confidence"] = "high"
-                properties["note"] = "Detected as on/off switch. If this device supports dimming, manually configure dimmable: true"
-                
-        elif isinstance(message, OWNAutomationEvent):
-            properties["shutter_type"] = "standard"
-            if hasattr(message, 'run_time'):
-                properties["run_time"] = message.run_time
-                
-        elif isinstance(message, OWNEnergyEvent):
-            properties["meter_type"] = "energy"
-            if hasattr(message, 'power'):
-                properties["power"] = message.power
-                
-        elif isinstance(message, OWNHeatingEvent):
-            properties["thermo_type"] = device_info["device_type"]
-            if hasattr(message, 'temperature'):
-                properties["temperature"] = message.temperature
     
     def _create_discovery_result(self, device_info: Dict[str, Any]) -> None:
-        """Create Home Assistant discovery result following OpenHAB patterns."""
-        try:
-            # Fire discovery event for Home Assistant
-            discovery_data = {
-                "platform": device_info["platform"],
-                "discovered_device": device_info,
-                "config_entry_id": self.config_entry.entry_id,
-                "gateway_mac": self.config_entry.data["mac"],
-            }
-            
-            self.hass.bus.async_fire(
-                f"{DOMAIN}_device_discovered",
-                discovery_data
-            )
-            
-            self.logger.info(
-                "Created discovery result for %s device %s at WHERE=%s",
-                device_info["device_type"],
-                device_info["name"],
-                device_info["where"]
+        """Record a newly discovered device and create its discovery result following OpenHAB patterns."""
+        # Callers have checked the device is new, this is the only place devices are added
+        where = device_info["where"]
+        self._discovered_devices[where] = device_info
+        self._seen_wheres.add(where)
+        
+        waiter = self._device_waiters.pop(where, None)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(device_info)
+        
+        # Hand the results over to the discovery config flow in batches,
+        # the devices of a batch share the time its first device was found
+        if self._pending_results_handle is None:
+            self._pending_results_stamp = datetime.now().isoformat()
+            self._pending_results_handle = self.hass.loop.call_later(
+                DISCOVERY_RESULT_BATCH_DELAY, self._send_discovery_results
             )
+        device_info["properties"]["discovered_at"] = self._pending_results_stamp
+        self._pending_results.append(device_info)
+        
+        self.logger.debug(
+            "Discovered new %s device %s at WHERE=%s",
+            device_info["device_type"],
+            device_info["name"],
+            where
+        )
+    
+    @callback
+    def _send_discovery_results(self) -> None:
+        """Send the pending discovery results to the discovery config flow."""
+        if self._pending_results_handle is not None:
+            self._pending_results_handle.cancel()
+            self._pending_results_handle = None
         
-        except Exception as e:
-            self.logger.error("Error creating discovery result for %s: %s", 
-                            device_info["unique_id"], e)
+        if not self._pending_results:
+            return
+        
+        devices, self._pending_results = self._pending_results, []
+        self.logger.info(
+            "Discovered %d new devices: %s",
+            len(devices),
+            ", ".join(device_info["name"] for device_info in devices)
+        )
+        async_dispatcher_send(
+            self.hass,
+            SIGNAL_DEVICES_DISCOVERED,
+            {
+                "devices": devices,
+                "config_entry_id": self._entry_id,
+                "gateway_mac": self._mac,
+            }
+        )
     
     async def _discovery_worker(self) -> None:
         """Worker task for active device discovery following OpenHAB patterns."""
         try:
             self.logger.debug("Discovery worker started")
             
-            # Send discovery commands following OpenHAB patterns
-            await self._send_discovery_commands()
-            
-            # Wait for discovery completion
-            while self._discovery_active:
-                await asyncio.sleep(1)
+            async with asyncio.timeout(self._discovery_timeout):
+                # Send discovery commands following OpenHAB patterns
+                await self._send_discovery_commands()
+                
+                # Wait for discovery to be stopped
+                await self._discovery_done.wait()
                 
+        except TimeoutError:
+            self._complete_discovery()
         except asyncio.CancelledError:
             self.logger.debug("Discovery worker cancelled")
         except Exception as e:
@@ -394,41 +557,28 @@ class MyHOMEDeviceDiscoveryService:
     
     async def _send_discovery_commands(self) -> None:
         """Send discovery commands to detect devices following OpenHAB patterns."""
-        # Send status requests for common device types
-        discovery_commands = [
-            "*#1*0##",   # Request all lighting device status (WHO=1)
-            "*#2*0##",   # Request all automation device status (WHO=2)
-            "*#4*0##",   # Request all thermoregulation device status (WHO=4)
-            "*#18*0##",  # Request all energy management device status (WHO=18) - May not be supported by all gateways
-            "*#25*0##",  # Request all CEN/dry contact device status (WHO=25)
-            "*#9*0##",   # Request all auxiliary device status (WHO=9) - May not be supported by all gateways
-        ]
-        
-        from OWNd.message import OWNCommand
-        
-        self.logger.info("Sending %d discovery commands...", len(discovery_commands))
+        self.logger.info("Sending %d discovery commands...", len(DISCOVERY_COMMANDS))
         
         successful_commands = 0
         failed_commands = []
         
-        for i, command in enumerate(discovery_commands, 1):
+        # Commands are only parsed once, then queued back to back
+        parsed_commands = []
+        for command, own_command in _parsed_discovery_commands():
+            if own_command is not None:
+                parsed_commands.append((command, own_command))
+            else:
+                self.logger.warning("Failed to parse command: %s", command)
+                failed_commands.append((command, "Invalid command format"))
+        
+        # Queueing does not wait, so discovery cannot be stopped halfway through
+        for i, (command, own_command) in enumerate(parsed_commands, 1):
             try:
-                if self._discovery_active:
-                    self.logger.info("Sending discovery command %d/%d: %s", i, len(discovery_commands), command)
-                    # Send command through gateway
-                    own_command = OWNCommand.parse(command)
-                    if own_command and own_command.is_valid:
-                        await self.gateway_handler.send_status_request(own_command)
-                        self.logger.debug("Command %s queued successfully", command)
-                        successful_commands += 1
-                    else:
-                        self.logger.warning("Failed to parse command: %s", command)
-                        failed_commands.append((command, "Invalid command format"))
-                    # Small delay between commands
-                    await asyncio.sleep(0.5)
-                else:
-                    self.logger.warning("Discovery deactivated during command sending")
-                    break
+                self.logger.info("Sending discovery command %d/%d: %s", i, len(parsed_commands), command)
+                # Queue command on the gateway, its sending workers pace the actual sends
+                await self.gateway_handler.send_status_request(own_command)
+                self.logger.debug("Command %s queued successfully", command)
+                successful_commands += 1
             except Exception as e:
                 self.logger.error("Error sending discovery command %s: %s", command, e)
                 failed_commands.append((command, str(e)))
@@ -439,40 +589,38 @@ class MyHOMEDeviceDiscoveryService:
         if failed_commands:
             self.logger.warning("Failed commands (this is normal if gateway doesn't support these subsystems):")
             for cmd, error in failed_commands:
-                who = cmd.split('*')[1] if '*' in cmd else '?'
-                subsystem_name = {
-                    "18": "Energy Management (WHO=18)",
-                    "9": "Auxiliary (WHO=9)",
-                    "25": "CEN/Dry Contact (WHO=25)"
-                }.get(who, f"WHO={who}")
+                # Status requests are *#WHO*WHERE##
+                who = cmd.split('*')[1].lstrip('#') if '*' in cmd else '?'
+                subsystem_name = _OPTIONAL_SUBSYSTEM_NAMES.get(who, f"WHO={who}")
                 self.logger.warning("  %s - %s (Command: %s)", subsystem_name, error, cmd)
         
         self.logger.info("Waiting for device responses...")
     
     @callback
     def _complete_discovery(self) -> None:
-        """Complete the discovery process."""
+        """Complete the discovery process when it times out."""
         if not self._discovery_active:
             return
         
-        self.logger.info(
-            "Discovery completed. Found %d devices", 
-            len(self._discovered_devices)
-        )
+        discovered_count = len(self._discovered_devices)
+        self.logger.info("Discovery completed. Found %d devices", discovered_count)
         
-        # Fire discovery completion event
-        self.hass.bus.async_fire(f"{DOMAIN}_discovery_completed", {
-            "gateway_mac": self.config_entry.data["mac"],
-            "discovered_count": len(self._discovered_devices),
-            "discovered_devices": list(self._discovered_devices.keys())
+        # Signal discovery completion, after the last discovered devices
+        self._send_discovery_results()
+        async_dispatcher_send(self.hass, SIGNAL_DISCOVERY_COMPLETED, {
+            "gateway_mac": self._mac,
+            "discovered_count": discovered_count,
+            "discovered_devices": tuple(
+                device_info["unique_id"] for device_info in self._discovered_devices.values()
+            )
         })
         
-        # Stop discovery
-        asyncio.create_task(self.stop_discovery())
+        # Stop discovery inline, this runs in the worker task once it timed out
+        self._async_stop_discovery()
     
-    def get_discovered_devices(self) -> Dict[str, Dict[str, Any]]:
-        """Get all discovered devices following OpenHAB patterns."""
-        return self._discovered_devices.copy()
+    def get_discovered_devices(self) -> Mapping[str, Dict[str, Any]]:
+        """Get a read-only view of all discovered devices by WHERE address following OpenHAB patterns."""
+        return self._discovered_devices_view
     
     def is_discovery_active(self) -> bool:
         """Check if discovery is currently active."""
@@ -483,26 +631,38 @@ class MyHOMEDeviceDiscoveryService:
     ) -> Optional[Dict[str, Any]]:
         """Discover a specific device by WHERE address following OpenHAB patterns."""
         try:
-            from OWNd.message import OWNCommand
+            if where in self._discovered_devices:
+                return self._discovered_devices[where]
             
-            # Try different WHO types for the address
-            # lighting, automation, thermo, energy, CEN, aux
-            who_types = [1, 2, 4, 18, 25, 9]
+            # Asked for explicitly, report the device even if already registered
+            self._seen_wheres.discard(where)
             
-            for who in who_types:
-                command = f"*#{who}*{where}##"
+            # Woken up as soon as the device shows up in a response
+            waiter = self._device_waiters.get(where)
+            if waiter is None:
+                waiter = self.hass.loop.create_future()
+                self._device_waiters[where] = waiter
+            
+            # Try different WHO types for the address
+            for who, command_format in _TARGETED_DISCOVERY_FORMATS:
+                command = command_format.format(where)
                 self.logger.debug(
                     "Discovering device at WHERE=%s with WHO=%s", where, who
                 )
                 
-                own_command = OWNCommand.parse(command)
-                if own_command and own_command.is_valid:
+                own_command = _parse_command(command)
+                if own_command is not None:
                     await self.gateway_handler.send_status_request(own_command)
-                    await asyncio.sleep(0.2)
             
-            # Check if device was discovered
-            device_id = f"{self.config_entry.data['mac']}-{where}"
-            return self._discovered_devices.get(device_id)
+            try:
+                # Shielded, other discoveries of the same address share the waiter
+                async with asyncio.timeout(DEVICE_DISCOVERY_TIMEOUT):
+                    return await asyncio.shield(waiter)
+            except TimeoutError:
+                self.logger.debug("No device answered at WHERE=%s", where)
+                if self._device_waiters.get(where) is waiter:
+                    del self._device_waiters[where]
+                return None
             
         except Exception as e:
             self.logger.error("Error discovering device at WHERE=%s: %s", where, e)
@@ -165,10 +165,10 @@ class MyHOMEGatewayHandler:
             )
             LOGGER.debug("%s Discovery service initialized", self.log_id)
     
-    async def start_device_discovery(self) -> None:
+    async def start_device_discovery(self, rediscover: bool = False) -> None:
         """Start device discovery following OpenHAB patterns."""
         if self.discovery_service:
-            await self.discovery_service.start_discovery()
+            await self.discovery_service.start_discovery(rediscover)
         else:
             LOGGER.warning("%s Discovery service not initialized", self.log_id)
     
@@ -91,12 +91,15 @@ class General(object):
         return "Where(%s, msg=%r)" % ("String", self.msg)
 
 
+_AREAS = frozenset(("00", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10"))
+
+
 class Area(object):
     def __init__(self, msg=None):
         self.msg = msg
 
     def __call__(self, v):
-        if type(v) == str and v in ["00", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10"]:
+        if type(v) == str and v in _AREAS:
             return v
         else:
             raise Invalid(f"Invalid Area WHERE {v}, it must be a string in [00, 1-9, 10].")
@@ -282,13 +285,17 @@ class MyHomeSensorSchema(Schema):
         return _rekeyed_data
 
 
+# All schemas below are built once at import time and shared by every config
+# entry setup; validators are stateless so the instances can be reused freely.
+_where_validator = All(
+    Coerce(str), Any(General(), Area(), Group(), PointToPoint(), msg="Invalid <WHERE>, expecting a valid General, Area, Group or Point-to-Point <WHERE>")
+)
+
 light_schema = MyHomeDeviceSchema(
     {
         Required(str): {
             Optional(CONF_WHO, default="1"): "1",
-            Required(CONF_WHERE): All(
-                Coerce(str), Any(General(), Area(), Group(), PointToPoint(), msg="Invalid <WHERE>, expecting a valid General, Area, Group or Point-to-Point <WHERE>")
-            ),
+            Required(CONF_WHERE): _where_validator,
             Optional(CONF_BUS_INTERFACE): All(Coerce(str), BusInterface()),
             Required(CONF_NAME): str,
             Optional(CONF_ENTITY_NAME): str,
@@ -305,9 +312,7 @@ switch_schema = MyHomeDeviceSchema(
     {
         Required(str): {
             Optional(CONF_WHO, default="1"): "1",
-            Required(CONF_WHERE): All(
-                Coerce(str), Any(General(), Area(), Group(), PointToPoint(), msg="Invalid <WHERE>, expecting a valid General, Area, Group or Point-to-Point <WHERE>")
-            ),
+            Required(CONF_WHERE): _where_validator,
             Optional(CONF_BUS_INTERFACE): All(Coerce(str), BusInterface()),
             Required(CONF_NAME): str,
             Optional(CONF_ENTITY_NAME): str,
@@ -329,9 +334,7 @@ cover_schema = MyHomeDeviceSchema(
     {
         Required(str): {
             Optional(CONF_WHO, default="2"): "2",
-            Required(CONF_WHERE): All(
-                Coerce(str), Any(General(), Area(), Group(), PointToPoint(), msg="Invalid <WHERE>, expecting a valid General, Area, Group or Point-to-Point <WHERE>")
-            ),
+            Required(CONF_WHERE): _where_validator,
             Optional(CONF_BUS_INTERFACE): All(Coerce(str), BusInterface()),
             Required(CONF_NAME): str,
             Optional(CONF_ENTITY_NAME): str,